@@ -24,13 +24,15 @@ import tomllib
 import subprocess
 import shutil
 import datetime
-import importlib.util
+import importlib  # importlib.util is imported where command modules get loaded
 import inspect
 import os
 import hashlib
 import time
-import threading
 import code
+import warnings
+import itertools
+from collections import deque
 
 # third-party libraries
 from pathlib import Path
@@ -102,6 +104,40 @@ class CommandMetadata:
 console = Console()
 
 # ---- REPL mode ----
+# Modules preloaded into every REPL; all are already imported by this module
+REPL_MODULES = {
+    'os': os,
+    'sys': sys,
+    'json': json,
+    'subprocess': subprocess,
+    'shutil': shutil,
+    'Path': Path,
+}
+
+REPL_HELP_TEXT = """
+PaoPao REPL Mode Help:
+
+Available built-in variables:
+  os, sys, json, subprocess, shutil, Path, console, cm
+
+Available built-in functions:
+  help()      - Show this help
+  exit()      - Exit REPL mode
+  clear()     - Clear screen
+  history()   - Show command history
+  load_command(name) - Load a PaoPao command for testing
+  run_command(cmd, args) - Safely run a command without exiting REPL
+
+Example usage:
+  >>> result = subprocess.run(['ls', '-la'], capture_output=True, text=True)
+  >>> print(result.stdout)
+  >>> passgen = load_command('passgen')
+  >>> run_command(passgen, ['--length', '12'])  # Safe execution
+  >>> passgen.main(['--length', '12'])          - Direct execution (may exit)
+
+Use Ctrl-D or type 'exit()' to quit.
+"""
+
 class REPL(code.InteractiveConsole):
     """Enhanced REPL for testing command scripts with PaoPao integration."""
     
@@ -111,42 +147,32 @@ class REPL(code.InteractiveConsole):
             local_vars = {}
         super().__init__(locals=local_vars)
         
-        self.stop_event = threading.Event()
         self.command_manager = command_manager
-        self.history = []
         self.max_history = 100
+        # A bounded deque drops the oldest command itself once it is full
+        self.history = deque(maxlen=self.max_history)
         self._should_exit = False
+        # Loaded command modules keyed by (name, path, mtime), so edits still reload
+        self._module_cache: Dict[Tuple[str, str, int], Any] = {}
+        # Names whose module was found to have no main(), mapped to that module
+        self._no_main: Dict[str, Any] = {}
+        # get_available_commands() result, reused while the command folders are unchanged
+        self._available_commands = None
+        self._available_commands_mtimes = None
+        # Compiled input keyed by source and the compiler's __future__ flags, so
+        # re-running the same snippet skips recompiling it
+        self.max_compile_cache = 128
+        self._compile_cache: Dict[Tuple[str, str, str, int], Any] = {}
+        self._command_compiler = self.compile
+        self.compile = self._compile_cached
         
         # Setup default environment after parent initialization
         self.setup_default_environment()
     
     def setup_default_environment(self):
         """Setup default REPL environment with useful imports and variables."""
-        # Import common modules with error handling
-        modules_to_import = {
-            'os': None,
-            'sys': None,
-            'json': None,
-            'subprocess': None,
-            'shutil': None,
-        }
-        
-        for name in modules_to_import:
-            try:
-                modules_to_import[name] = __import__(name)
-            except ImportError:
-                console.print(f"[yellow]Warning: Could not import {name}[/yellow]")
-                modules_to_import[name] = None
-        
-        # Import Path separately
-        try:
-            from pathlib import Path
-            modules_to_import['Path'] = Path
-        except ImportError:
-            console.print("[yellow]Warning: Could not import Path from pathlib[/yellow]")
-        
-        # Make them available in REPL
-        self.locals.update(modules_to_import)
+        # Make the common modules available in REPL
+        self.locals.update(REPL_MODULES)
         self.locals.update({
             'console': console,
             'cm': self.command_manager,
@@ -159,17 +185,55 @@ class REPL(code.InteractiveConsole):
             'run_command': self.run_command_safe
         })
     
+    def _command_folder_mtimes(self) -> List[Tuple[str, int]]:
+        """Collect the mtimes of every folder get_available_commands() scans."""
+        config = self.command_manager.config
+        mtimes = []
+        # Commands live up to two levels down (<dir>/main.py, <addon>/commands/*.py),
+        # and adding a file only changes the mtime of the folder it lands in
+        pending = [(str(config.COMMANDS_DIR), 1), (str(config.COMMUNITY_COMMANDS_DIR), 2)]
+        while pending:
+            folder, depth = pending.pop()
+            try:
+                mtimes.append((folder, os.stat(folder).st_mtime_ns))
+                if depth:
+                    with os.scandir(folder) as it:
+                        pending.extend((entry.path, depth - 1) for entry in it if entry.is_dir())
+            except OSError:
+                mtimes.append((folder, -1))
+        mtimes.sort()
+        return mtimes
+    
+    def _get_available_commands(self):
+        """Get the command manager's commands, rescanning only when a command folder changes."""
+        mtimes = self._command_folder_mtimes()
+        
+        if self._available_commands is None or mtimes != self._available_commands_mtimes:
+            self._available_commands = self.command_manager.get_available_commands()
+            self._available_commands_mtimes = mtimes
+        return self._available_commands
+    
     def load_command_test(self, command_name):
         """Load a command for testing in REPL."""
+        import importlib.util
         if self.command_manager:
             try:
-                commands_metadata, command_paths = self.command_manager.get_available_commands()
+                commands_metadata, command_paths = self._get_available_commands()
                 if command_name in command_paths:
                     try:
-                        spec = importlib.util.spec_from_file_location(command_name, command_paths[command_name])
+                        path = command_paths[command_name]
+                        key = (command_name, str(path), os.stat(path).st_mtime_ns)
+                        module = self._module_cache.get(key)
+                        if module is not None:
+                            self.locals[command_name] = module
+                            console.print(f"✅ Loaded command '{command_name}' as variable '{command_name}' (cached)")
+                            return module
+                        
+                        spec = importlib.util.spec_from_file_location(command_name, path)
                         if spec and spec.loader:
                             module = importlib.util.module_from_spec(spec)
                             spec.loader.exec_module(module)
+                            self._module_cache[key] = module
                             self.locals[command_name] = module
                             console.print(f"✅ Loaded command '{command_name}' as variable '{command_name}'")
                             return module
@@ -189,21 +253,23 @@ class REPL(code.InteractiveConsole):
             args = []
         
         try:
-            # Check if it's a loaded module
-            if isinstance(command_name, str) and command_name in self.locals:
-                module = self.locals[command_name]
-            elif hasattr(command_name, 'main'):
-                module = command_name
-            else:
+            # A name refers to a loaded module; anything else is the module itself
+            module = self.locals.get(command_name) if isinstance(command_name, str) else command_name
+            if module is None:
                 console.print(f"❌ Command '{command_name}' not found or not loaded")
                 return False
+            if isinstance(command_name, str) and self._no_main.get(command_name) is module:
+                return False  # Already reported for this same module
             
             # Run the command with error handling
-            if hasattr(module, 'main') and callable(module.main):
-                module.main(args)
+            main = getattr(module, 'main', None)
+            if callable(main):
+                main(args)
                 return True
             else:
                 console.print(f"❌ Module has no callable main() function")
+                if isinstance(command_name, str):
+                    self._no_main[command_name] = module
                 return False
             
         except SystemExit as e:
@@ -216,38 +282,11 @@ class REPL(code.InteractiveConsole):
     
     def show_help(self):
         """Show REPL help information."""
-        help_text = """
-PaoPao REPL Mode Help:
-
-Available built-in variables:
-  os, sys, json, subprocess, shutil, Path, console, cm
-
-Available built-in functions:
-  help()      - Show this help
-  exit()      - Exit REPL mode
-  clear()     - Clear screen
-  history()   - Show command history
-  load_command(name) - Load a PaoPao command for testing
-  run_command(cmd, args) - Safely run a command without exiting REPL
-
-Example usage:
-  >>> result = subprocess.run(['ls', '-la'], capture_output=True, text=True)
-  >>> print(result.stdout)
-  >>> passgen = load_command('passgen')
-  >>> run_command(passgen, ['--length', '12'])  # Safe execution
-  >>> passgen.main(['--length', '12'])          - Direct execution (may exit)
-
-Use Ctrl-D or type 'exit()' to quit.
-"""
-        
         if RICH_AVAILABLE:
-            console.print(Panel.fit(help_text, title="🧪 REPL Help", border_style="blue"))
+            console.print(Panel.fit(REPL_HELP_TEXT, title="🧪 REPL Help", border_style="blue"))
         else:
-            print("=" * 50)
-            print("🧪 REPL Help")
-            print("=" * 50)
-            print(help_text)
-            print("=" * 50)
+            rule = "=" * 50
+            sys.stdout.write(f"{rule}\n🧪 REPL Help\n{rule}\n{REPL_HELP_TEXT}\n{rule}\n")
     
     def exit_repl(self, *_):
         """Exit the REPL."""
@@ -265,31 +304,54 @@ Use Ctrl-D or type 'exit()' to quit.
             console.print("No history yet")
             return
         
+        # Show last 10 commands
+        recent = itertools.islice(self.history, max(0, len(self.history) - 10), None)
+        
         if RICH_AVAILABLE:
             table = Table(title="📜 Command History", box=box.SIMPLE)
             table.add_column("#", style="dim")
             table.add_column("Command", style="cyan")
             
-            for i, cmd in enumerate(self.history[-10:], 1):  # Show last 10 commands
+            for i, cmd in enumerate(recent, 1):
                 table.add_row(str(i), cmd)
             
             console.print(table)
         else:
-            print("📜 Command History:")
-            for i, cmd in enumerate(self.history[-10:], 1):
-                print(f"{i:2d}. {cmd}")
+            lines = [f"{i:2d}. {cmd}" for i, cmd in enumerate(recent, 1)]
+            sys.stdout.write("📜 Command History:\n" + "\n".join(lines) + "\n")
         
         return f"Showing {len(self.history)} commands in history"
     
+    def _compile_cached(self, source, filename="<input>", symbol="single"):
+        """Compile input like code.CommandCompiler, reusing code for repeated sources."""
+        key = (source, filename, symbol, self._command_compiler.compiler.flags)
+        if key not in self._compile_cache:
+            if len(self._compile_cache) >= self.max_compile_cache:
+                # Evict the oldest entry; dicts keep insertion order
+                del self._compile_cache[next(iter(self._compile_cache))]
+            self._compile_cache[key] = self._compile_source(source, filename, symbol)
+        return self._compile_cache[key]
+    
+    def _compile_source(self, source, filename, symbol):
+        """Compile input directly, falling back to codeop when it is not plainly complete."""
+        # codeop compiles complete input twice: once with warnings silenced to test for
+        # incompleteness, then again for real. A single compile with warnings as errors
+        # settles the common case; anything it rejects goes through codeop unchanged.
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", (SyntaxWarning, DeprecationWarning))
+            try:
+                return self._command_compiler.compiler(source, filename, symbol)
+            except (SyntaxError, SyntaxWarning, DeprecationWarning, ValueError, OverflowError):
+                pass
+        return self._command_compiler(source, filename, symbol)
+    
     def runsource(self, source, filename="<input>", symbol="single"):
         """Override to capture history and handle multi-line input."""
-        if source.strip():  # Only add non-empty commands to history
-            self.history.append(source)
-            if len(self.history) > self.max_history:
-                self.history.pop(0)
-        
         try:
             result = super().runsource(source, filename, symbol)
+            # push() passes the whole buffered block, so store it once, when complete
+            if not result and source and not source.isspace():  # Only add non-empty commands to history
+                self.history.append(source.rstrip("\n"))
             # If user called exit(), we need to propagate the SystemExit
             if self._should_exit:
                 raise SystemExit("Exiting REPL")
@@ -326,6 +388,7 @@ Use run_command() for safe execution without exiting REPL
         
         try:
             # Use the standard interact method but with our custom handling
+            raw_input, push, resetbuffer = self.raw_input, self.push, self.resetbuffer
             more = 0
             while not self._should_exit:
                 try:
@@ -336,7 +399,7 @@ Use run_command() for safe execution without exiting REPL
                         prompt = ">>> "  # Primary prompt
                     
                     try:
-                        line = self.raw_input(prompt)
+                        line = raw_input(prompt)
                     except EOFError:
                         console.print("\n👋 Exiting REPL mode (EOF)...")
                         break
@@ -345,11 +408,11 @@ Use run_command() for safe execution without exiting REPL
                         console.print("👋 Exiting REPL mode...")
                         break
                     
-                    more = self.push(line)
+                    more = push(line)
                     
                 except KeyboardInterrupt:
                     console.print("\nKeyboardInterrupt")
-                    self.resetbuffer()
+                    resetbuffer()
                     more = 0
                 except SystemExit as e:
                     if "Exiting REPL" in str(e):
@@ -357,7 +420,7 @@ Use run_command() for safe execution without exiting REPL
                         break
                     else:
                         console.print("⚠️ Command attempted to exit REPL - caught and prevented")
-                        self.resetbuffer()
+                        resetbuffer()
                         more = 0
                         
         except Exception as e:
@@ -711,6 +774,7 @@ class CommandManager:
     
     def load_and_run_command(self, command_name: str, argv: list):
         """Dynamically load and execute a command module with enhanced error handling."""
+        import importlib.util
         try:
             commands_metadata, command_paths = self.get_available_commands()
         except Exception as e:
@@ -1214,6 +1278,7 @@ class BuiltinCommands:
     
     def _check_commands(self, verbose: bool) -> str:
         """Validate all installed commands."""
+        import importlib.util
         try:
             commands_metadata, command_paths = self.cm.get_available_commands(use_cache=False)
         except Exception as e:
@@ -1549,6 +1614,7 @@ class BuiltinCommands:
 
     def test(self, argv: list):
         """Enhanced test command with better validation."""
+        import importlib.util
         formatter_class = rich_argparse.RichHelpFormatter if RICH_AVAILABLE else argparse.HelpFormatter
         
         parser = argparse.ArgumentParser(
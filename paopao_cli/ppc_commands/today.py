@@ -5,24 +5,38 @@ A comprehensive tool for displaying dates, calendars, and time information with
 """
 
 import argparse
+import bisect
 import calendar
 import locale
 import sys
-from datetime import datetime, timedelta, date
-from typing import Optional, List, Dict, Tuple
+from datetime import datetime, timedelta, date, time
+from typing import Callable, Optional, List, Dict, NamedTuple, Tuple
 from dataclasses import dataclass
 from zoneinfo import ZoneInfo
 import re
+from functools import lru_cache
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.columns import Columns
-from rich.text import Text
+from rich.text import Span, Text
 from rich.theme import Theme
 from rich.table import Table
 from rich.align import Align
 from rich.layout import Layout
 
+# Performance notes: everything here is pure-Python interpreter work on a
+# few hundred small objects per render (a full year is ~400 day cells), so
+# cost comes from bytecode dispatch and allocation, not IO or memory
+# bandwidth. Keep optimisations at that level: fewer temporary objects,
+# lru_cache on pure helpers, and C-implemented stdlib calls (bisect,
+# ordinals, f-strings). Numba/Cython or vectorisation would spend more on
+# import and warm-up than the whole command takes to run.
+
+# Module-level bindings for hot calendar/date helpers
+_isleap = calendar.isleap
+_month_name = calendar.month_name
+_now = datetime.now
+
 # Enhanced custom theme with more colors and styles
 CUSTOM_THEME = Theme({
     "weekday": "bold cyan",
@@ -44,114 +58,96 @@ CUSTOM_THEME = Theme({
     "time_info": "bold bright_blue",
 })
 
-console = Console(theme=CUSTOM_THEME)
+@lru_cache(maxsize=None)
+def _get_console() -> Console:
+    """Create the themed console on first use."""
+    return Console(theme=CUSTOM_THEME)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration and Data Classes  
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True)
 class DateInfo:
     """Comprehensive date information."""
+    # Written out by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("date", "day_of_year", "week_of_year", "days_until_new_year",
+                 "season", "zodiac_sign", "is_weekend", "is_leap_year")
+    
     date: datetime
     day_of_year: int
     week_of_year: int
     days_until_new_year: int
     season: str
     zodiac_sign: str
-    weekday_name: str
-    month_name: str
     is_weekend: bool
     is_leap_year: bool
+    
+    @property
+    def weekday_name(self) -> str:
+        """Full weekday name, looked up on demand."""
+        return _WEEKDAYS[self.date.weekday()]
+    
+    @property
+    def month_name(self) -> str:
+        """Full month name, looked up on demand."""
+        return _MONTHS[self.date.month - 1]
 
-@dataclass
-class Holiday:
+class Holiday(NamedTuple):
     """Holiday information."""
     name: str
     date: date
     type: str  # "fixed", "floating", "lunar"
 
-class HolidayCalculator:
-    """Calculate various holidays and special dates."""
-    
-    @staticmethod
-    def get_easter_date(year: int) -> date:
-        """Calculate Easter date using the algorithm."""
-        # Anonymous Gregorian algorithm
-        a = year % 19
-        b = year // 100
-        c = year % 100
-        d = b // 4
-        e = b % 4
-        f = (b + 8) // 25
-        g = (b - f + 1) // 3
-        h = (19 * a + b - d - g + 15) % 30
-        i = c // 4
-        k = c % 4
-        l = (32 + 2 * e + 2 * i - h - k) % 7
-        m = (a + 11 * h + 22 * l) // 451
-        month = (h + l - 7 * m + 114) // 31
-        day = ((h + l - 7 * m + 114) % 31) + 1
-        return date(year, month, day)
-    
-    @staticmethod
-    def get_us_holidays(year: int) -> List[Holiday]:
-        """Get US federal holidays for a given year."""
-        holidays = []
-        
+def get_easter_date(year: int) -> date:
+    """Calculate Easter date using the algorithm."""
+    # Anonymous Gregorian algorithm
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    return date(year, month, day)
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Return the n-th given weekday (Monday = 0) of a month."""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7, weeks=n - 1)
+
+@lru_cache(maxsize=32)
+def get_us_holidays(year: int) -> Tuple[Holiday, ...]:
+    """Get US federal holidays for a given year."""
+    may_31 = date(year, 5, 31)
+    easter = get_easter_date(year)
+    
+    return (
         # Fixed date holidays
-        holidays.append(Holiday("New Year's Day", date(year, 1, 1), "fixed"))
-        holidays.append(Holiday("Independence Day", date(year, 7, 4), "fixed"))
-        holidays.append(Holiday("Veterans Day", date(year, 11, 11), "fixed"))
-        holidays.append(Holiday("Christmas Day", date(year, 12, 25), "fixed"))
+        Holiday("New Year's Day", date(year, 1, 1), "fixed"),
+        Holiday("Independence Day", date(year, 7, 4), "fixed"),
+        Holiday("Veterans Day", date(year, 11, 11), "fixed"),
+        Holiday("Christmas Day", date(year, 12, 25), "fixed"),
         
         # Floating holidays
-        # Martin Luther King Jr. Day (3rd Monday in January)
-        jan_1 = date(year, 1, 1)
-        days_to_monday = (7 - jan_1.weekday()) % 7
-        first_monday = jan_1 + timedelta(days=days_to_monday)
-        mlk_day = first_monday + timedelta(weeks=2)
-        holidays.append(Holiday("Martin Luther King Jr. Day", mlk_day, "floating"))
-        
-        # Presidents Day (3rd Monday in February)
-        feb_1 = date(year, 2, 1)
-        days_to_monday = (7 - feb_1.weekday()) % 7
-        first_monday = feb_1 + timedelta(days=days_to_monday)
-        presidents_day = first_monday + timedelta(weeks=2)
-        holidays.append(Holiday("Presidents Day", presidents_day, "floating"))
-        
-        # Memorial Day (last Monday in May)
-        may_31 = date(year, 5, 31)
-        days_to_last_monday = may_31.weekday()
-        memorial_day = may_31 - timedelta(days=days_to_last_monday)
-        holidays.append(Holiday("Memorial Day", memorial_day, "floating"))
-        
-        # Labor Day (1st Monday in September)
-        sep_1 = date(year, 9, 1)
-        days_to_monday = (7 - sep_1.weekday()) % 7
-        labor_day = sep_1 + timedelta(days=days_to_monday)
-        holidays.append(Holiday("Labor Day", labor_day, "floating"))
-        
-        # Columbus Day (2nd Monday in October)
-        oct_1 = date(year, 10, 1)
-        days_to_monday = (7 - oct_1.weekday()) % 7
-        first_monday = oct_1 + timedelta(days=days_to_monday)
-        columbus_day = first_monday + timedelta(weeks=1)
-        holidays.append(Holiday("Columbus Day", columbus_day, "floating"))
-        
-        # Thanksgiving (4th Thursday in November)
-        nov_1 = date(year, 11, 1)
-        days_to_thursday = (3 - nov_1.weekday()) % 7
-        first_thursday = nov_1 + timedelta(days=days_to_thursday)
-        thanksgiving = first_thursday + timedelta(weeks=3)
-        holidays.append(Holiday("Thanksgiving Day", thanksgiving, "floating"))
+        Holiday("Martin Luther King Jr. Day", _nth_weekday(year, 1, 0, 3), "floating"),
+        Holiday("Presidents Day", _nth_weekday(year, 2, 0, 3), "floating"),
+        Holiday("Memorial Day", may_31 - timedelta(days=may_31.weekday()), "floating"),  # Last Monday in May
+        Holiday("Labor Day", _nth_weekday(year, 9, 0, 1), "floating"),
+        Holiday("Columbus Day", _nth_weekday(year, 10, 0, 2), "floating"),
+        Holiday("Thanksgiving Day", _nth_weekday(year, 11, 3, 4), "floating"),
         
         # Easter-based holidays
-        easter = HolidayCalculator.get_easter_date(year)
-        holidays.append(Holiday("Easter Sunday", easter, "lunar"))
-        holidays.append(Holiday("Good Friday", easter - timedelta(days=2), "lunar"))
-        
-        return holidays
+        Holiday("Easter Sunday", easter, "lunar"),
+        Holiday("Good Friday", easter - timedelta(days=2), "lunar"),
+    )
 
 def get_season(date_obj: datetime) -> str:
     """Determine the season for a given date."""
@@ -184,27 +180,25 @@ def get_zodiac_sign(date_obj: datetime) -> str:
             return sign
     return "Capricorn"
 
+# Lunar cycle day thresholds and the phase that starts at each one
+_MOON_EPOCH_ORDINAL = 730125  # date(2000, 1, 6).toordinal(), a known new moon
+_MOON_THRESHOLDS = (1, 7, 8, 15, 16, 22, 23)
+_MOON_PHASES = (
+    "🌑 New Moon",
+    "🌒 Waxing Crescent",
+    "🌓 First Quarter",
+    "🌔 Waxing Gibbous",
+    "🌕 Full Moon",
+    "🌖 Waning Gibbous",
+    "🌗 Last Quarter",
+    "🌘 Waning Crescent",
+)
+
 def get_moon_phase(date_obj: datetime) -> str:
     """Approximate moon phase calculation."""
     # This is a simplified calculation
-    days_since_new = (date_obj - datetime(2000, 1, 6)).days % 29.53
-    
-    if days_since_new < 1:
-        return "🌑 New Moon"
-    elif days_since_new < 7:
-        return "🌒 Waxing Crescent"
-    elif days_since_new < 8:
-        return "🌓 First Quarter"
-    elif days_since_new < 15:
-        return "🌔 Waxing Gibbous"
-    elif days_since_new < 16:
-        return "🌕 Full Moon"
-    elif days_since_new < 22:
-        return "🌖 Waning Gibbous"
-    elif days_since_new < 23:
-        return "🌗 Last Quarter"
-    else:
-        return "🌘 Waning Crescent"
+    days_since_new = (date_obj.toordinal() - _MOON_EPOCH_ORDINAL) % 29.53
+    return _MOON_PHASES[bisect.bisect_right(_MOON_THRESHOLDS, days_since_new)]
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Date and Time Formatting Functions
@@ -213,35 +207,72 @@ def get_moon_phase(date_obj: datetime) -> str:
 def get_comprehensive_date_info(dt: Optional[datetime] = None, timezone: Optional[str] = None) -> DateInfo:
     """Get comprehensive information about a date."""
     if dt is None:
-        dt = datetime.now()
+        dt = _now()
     
     if timezone:
         try:
             tz = ZoneInfo(timezone)
             dt = dt.replace(tzinfo=tz)
         except Exception:
-            console.print(f"[yellow]Warning: Invalid timezone '{timezone}', using local time[/]")
+            _get_console().print(f"[yellow]Warning: Invalid timezone '{timezone}', using local time[/]")
     
-    year_start = datetime(dt.year, 1, 1)
-    year_end = datetime(dt.year + 1, 1, 1)
+    day_ordinal = dt.toordinal()
+    day_of_year = day_ordinal - date(dt.year, 1, 1).toordinal() + 1
+    
+    # Whole days left until New Year's midnight; a partly elapsed day doesn't count
+    days_until_new_year = date(dt.year + 1, 1, 1).toordinal() - day_ordinal
+    if dt.time() != time.min:
+        days_until_new_year -= 1
     
     return DateInfo(
         date=dt,
-        day_of_year=dt.timetuple().tm_yday,
-        week_of_year=dt.isocalendar()[1],
-        days_until_new_year=(year_end - dt).days,
+        day_of_year=day_of_year,
+        week_of_year=dt.isocalendar().week,
+        days_until_new_year=days_until_new_year,
         season=get_season(dt),
         zodiac_sign=get_zodiac_sign(dt),
-        weekday_name=dt.strftime("%A"),
-        month_name=dt.strftime("%B"),
         is_weekend=dt.weekday() >= 5,
-        is_leap_year=calendar.isleap(dt.year)
+        is_leap_year=_isleap(dt.year)
     )
 
+_WEEKDAYS = tuple(calendar.day_name)
+_MONTHS = tuple(calendar.month_name)[1:]
+
+def _format_relative(dt: datetime) -> str:
+    """Describe a date relative to now."""
+    diff = dt - _now()
+    if abs(diff.days) == 0:
+        return "Today"
+    elif diff.days == 1:
+        return "Tomorrow"
+    elif diff.days == -1:
+        return "Yesterday"
+    elif diff.days > 0:
+        return f"In {diff.days} days"
+    else:
+        return f"{abs(diff.days)} days ago"
+
+def _format_long(dt: datetime) -> str:
+    """Format a date as the default long form."""
+    return (f"📅 {_WEEKDAYS[dt.weekday()]}, {dt.day:02d} {_MONTHS[dt.month - 1]} {dt.year} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
+
+_FORMATTERS: Dict[str, Callable[[datetime], str]] = {
+    "iso": datetime.isoformat,
+    "short": lambda dt: f"{dt.day:02d}/{dt.month:02d}/{dt.year}",
+    "us": lambda dt: f"{dt.month:02d}/{dt.day:02d}/{dt.year}",
+    "european": lambda dt: f"{dt.day:02d}.{dt.month:02d}.{dt.year}",
+    "timestamp": lambda dt: str(int(dt.timestamp())),
+    "relative": _format_relative,
+}
+
+# Formats that carry no styling and can be printed without a Rich console
+PLAIN_FORMATS = frozenset(_FORMATTERS)
+
 def format_date_output(fmt: str = "long", dt: Optional[datetime] = None, timezone: Optional[str] = None) -> str:
     """Format date output in various formats."""
     if dt is None:
-        dt = datetime.now()
+        dt = _now()
     
     if timezone:
         try:
@@ -250,34 +281,11 @@ def format_date_output(fmt: str = "long", dt: Optional[datetime] = None, timezon
         except Exception:
             pass
     
-    if fmt == "iso":
-        return dt.isoformat()
-    elif fmt == "short":
-        return dt.strftime("%d/%m/%Y")
-    elif fmt == "us":
-        return dt.strftime("%m/%d/%Y")
-    elif fmt == "european":
-        return dt.strftime("%d.%m.%Y")
-    elif fmt == "timestamp":
-        return str(int(dt.timestamp()))
-    elif fmt == "relative":
-        now = datetime.now()
-        diff = dt - now
-        if abs(diff.days) == 0:
-            return "Today"
-        elif diff.days == 1:
-            return "Tomorrow"
-        elif diff.days == -1:
-            return "Yesterday"
-        elif diff.days > 0:
-            return f"In {diff.days} days"
-        else:
-            return f"{abs(diff.days)} days ago"
-    else:  # long format
-        return dt.strftime("📅 %A, %d %B %Y %H:%M:%S")
+    return _FORMATTERS.get(fmt, _format_long)(dt)
 
 def show_detailed_date_info(dt: Optional[datetime] = None, timezone: Optional[str] = None):
     """Show comprehensive date information in a nice table."""
+    console = _get_console()
     info = get_comprehensive_date_info(dt, timezone)
     
     table = Table(title="📅 Date Information", show_header=False, box=None)
@@ -285,8 +293,9 @@ def show_detailed_date_info(dt: Optional[datetime] = None, timezone: Optional[st
     table.add_column("Value", style="green")
     
     # Basic date info
-    table.add_row("Date", info.date.strftime("%A, %B %d, %Y"))
-    table.add_row("Time", info.date.strftime("%H:%M:%S"))
+    dt = info.date
+    table.add_row("Date", f"{_WEEKDAYS[dt.weekday()]}, {_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}")
+    table.add_row("Time", f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
     if info.date.tzinfo:
         table.add_row("Timezone", str(info.date.tzinfo))
     
@@ -311,216 +320,259 @@ def show_detailed_date_info(dt: Optional[datetime] = None, timezone: Optional[st
 # Calendar Display Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
-def highlight_calendar_day(day_num: int, weekday: int, year: int, month: int, 
-                          holidays: Dict[date, Holiday]) -> Text:
-    """Apply appropriate styling to a calendar day."""
-    today = datetime.now()
-    today_date = today.date() if today.year == year and today.month == month else None
-    current_date = date(year, month, day_num)
-    
-    # Create base text
-    day_text = Text(f"{day_num:2d}")
-    
-    # Apply styling based on various conditions
-    if day_num == (today_date.day if today_date else -1):
-        day_text.stylize("today")
-    elif current_date in holidays:
-        day_text.stylize("holiday")
-    elif weekday == 5:  # Saturday
-        day_text.stylize("saturday")
-    elif weekday == 6:  # Sunday
-        day_text.stylize("sunday")
-    elif current_date < today.date():
-        day_text.stylize("past_day")
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _month_start_weekday(year: int, month: int) -> int:
+    """Weekday (Monday = 0) of the 1st of a month, via Zeller's congruence."""
+    # Treat January and February as months 13 and 14 of the previous year
+    if month < 3:
+        year -= 1
+        month += 12
+    h = (1 + 13 * (month + 1) // 5 + year + year // 4 - year // 100 + year // 400) % 7
+    return (h + 5) % 7  # Zeller counts from Saturday
+
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in a month."""
+    return 29 if month == 2 and _isleap(year) else _DAYS_IN_MONTH[month]
+
+@lru_cache(maxsize=32)
+def get_month_weeks(year: int, month: int) -> Tuple[Tuple[int, ...], ...]:
+    """Get the Monday-first week rows of a month, zero-padded like monthcalendar."""
+    first_weekday = _month_start_weekday(year, month)
+    cells = (0,) * first_weekday + tuple(range(1, _days_in_month(year, month) + 1))
+    cells += (0,) * (-len(cells) % 7)
+    return tuple(cells[i:i + 7] for i in range(0, len(cells), 7))
+
+def get_month_day_styles(year: int, month: int, holidays: Dict[date, Holiday],
+                         today: Optional[date] = None) -> List[str]:
+    """Pick the theme style for every day of a month, indexed by day number."""
+    first_weekday = _month_start_weekday(year, month)
+    days_in_month = _days_in_month(year, month)
+    if today is None:
+        today = _now()
+    
+    # Past and future months are uniform; only the current month is split
+    # and only it needs a "today" cell
+    today_day = 0
+    if (year, month) < (today.year, today.month):
+        past_days = days_in_month
+    elif (year, month) > (today.year, today.month):
+        past_days = 0
     else:
-        day_text.stylize("weekday")
-    
-    return day_text
+        today_day = today.day
+        past_days = today_day - 1
+    styles = ["past_day"] * (past_days + 1) + ["weekday"] * (days_in_month - past_days)
+    
+    # Layer the higher-priority styles on top: weekends, holidays, then today
+    first_saturday = (5 - first_weekday) % 7 + 1
+    styles[first_saturday::7] = ["saturday"] * len(styles[first_saturday::7])
+    first_sunday = (6 - first_weekday) % 7 + 1
+    styles[first_sunday::7] = ["sunday"] * len(styles[first_sunday::7])
+    for holiday_date in holidays:
+        styles[holiday_date.day] = "holiday"
+    if today_day:
+        styles[today_day] = "today"
+    
+    return styles
+
+# Fixed calendar header rows
+_WEEK_HEADER = "Mo Tu We Th Fr Sa Su"
+_WEEK_HEADER_NUMBERED = "Wk " + _WEEK_HEADER
+
+# Three-character day cells (right-aligned number plus separator), indexed by
+# day number; index 0 is the blank padding cell
+_DAY_CELLS = ("   ",) + tuple(f"{d:2d} " for d in range(1, 32))
 
 def create_enhanced_month_calendar(year: int, month: int, show_week_numbers: bool = False,
-                                 show_holidays: bool = True) -> Text:
+                                 show_holidays: bool = True, today: Optional[date] = None) -> Text:
     """Create an enhanced month calendar with various features."""
-    month_name = calendar.month_name[month]
+    month_name = _month_name[month]
     
     # Get holidays for the year
     holidays = {}
     if show_holidays:
-        holiday_list = HolidayCalculator.get_us_holidays(year)
+        holiday_list = get_us_holidays(year)
         holidays = {h.date: h for h in holiday_list if h.date.month == month}
     
-    # Create header
-    header = Text(f"{month_name} {year}".center(20 if not show_week_numbers else 23), style="month_title")
-    
-    # Week header
-    week_header = "Mo Tu We Th Fr Sa Su"
-    if show_week_numbers:
-        week_header = "Wk " + week_header
-    week_header_text = Text(week_header, style="month_title")
+    # Collect the plain text and its style spans, then build one Text at the end
+    week_header = _WEEK_HEADER_NUMBERED if show_week_numbers else _WEEK_HEADER
+    title = f"{month_name} {year}".center(len(week_header))
+    header_end = len(title) + 1 + len(week_header)
+    parts = [title, "\n", week_header]
+    spans = [Span(0, len(title), "month_title"), Span(len(title) + 1, header_end, "month_title")]
+    offset = header_end
     
     # Get calendar data
-    weeks = calendar.monthcalendar(year, month)
-    calendar_lines = [header, week_header_text]
+    weeks = get_month_weeks(year, month)
+    
+    day_styles = get_month_day_styles(year, month, holidays, today)
+    
+    # Calendar rows run Monday..Sunday, so each row is exactly one ISO week
+    first_iso_week = date(year, month, 1).isocalendar()[1] if show_week_numbers else 0
     
     for week_index, week in enumerate(weeks):
-        line_parts = []
+        parts.append("\n")
+        offset += 1
         
         # Add week number if requested
         if show_week_numbers:
-            week_num = date(year, month, max(d for d in week if d > 0)).isocalendar()[1]
-            line_parts.append(Text(f"{week_num:2d} ", style="week_number"))
-        
-        # Add days
-        for day_index, day in enumerate(week):
-            if day == 0:
-                line_parts.append(Text("   "))
-            else:
-                day_text = highlight_calendar_day(day, day_index, year, month, holidays)
-                line_parts.append(day_text)
-                line_parts.append(Text(" "))
+            week_num = first_iso_week + week_index
+            if week_num > 52:
+                # Week 53 or a wrap into week 1 only happens around New Year
+                week_num = date(year, month, max(week)).isocalendar()[1]
+            parts.append(f"{week_num:2d} ")
+            spans.append(Span(offset, offset + 3, "week_number"))
+            offset += 3
         
-        # Combine line parts
-        line = Text()
-        for part in line_parts:
-            line.append_text(part)
-        calendar_lines.append(line)
+        # Add days; every cell is three characters wide, blank or not
+        for day in week:
+            parts.append(_DAY_CELLS[day])
+            if day:
+                spans.append(Span(offset, offset + 2, day_styles[day]))
+            offset += 3
     
     # Add holiday information at the bottom
     if holidays:
-        calendar_lines.append(Text())
-        calendar_lines.append(Text("Holidays:", style="bold yellow"))
+        parts.append("\n\nHolidays:")
+        spans.append(Span(offset + 2, offset + 11, "bold yellow"))
+        offset += 11
         for holiday in sorted(holidays.values(), key=lambda h: h.date.day):
-            holiday_text = Text(f"  {holiday.date.day}: {holiday.name}", style="holiday")
-            calendar_lines.append(holiday_text)
+            line = f"  {holiday.date.day}: {holiday.name}"
+            parts.append("\n" + line)
+            spans.append(Span(offset + 1, offset + 1 + len(line), "holiday"))
+            offset += 1 + len(line)
     
-    # Combine all lines
-    result = Text()
-    for i, line in enumerate(calendar_lines):
-        if i > 0:
-            result.append("\n")
-        result.append_text(line)
-    
-    return result
+    return Text("".join(parts), spans=spans)
 
 def show_calendar(year: Optional[int] = None, month: Optional[int] = None, 
                  show_week_numbers: bool = False, show_holidays: bool = True):
     """Display a single month calendar."""
-    now = datetime.now()
+    console = _get_console()
+    now = _now()
     year = year or now.year
     month = month or now.month
     
     calendar_text = create_enhanced_month_calendar(year, month, show_week_numbers, show_holidays)
-    title = f"{calendar.month_name[month]} {year}"
+    title = f"{_month_name[month]} {year}"
     
     console.print(Panel(calendar_text, title=title, style="cyan", expand=False))
 
 def show_full_year_calendar(year: Optional[int] = None, show_week_numbers: bool = False):
     """Display a full year calendar with quarters."""
-    year = year or datetime.now().year
+    console = _get_console()
+    today = _now().date()
+    year = year or today.year
     quarter_colors = ["bold blue", "bold green", "bold yellow", "bold magenta"]
     quarter_names = ["Q1 (Winter/Spring)", "Q2 (Spring/Summer)", 
                     "Q3 (Summer/Autumn)", "Q4 (Autumn/Winter)"]
     
-    # Create title
+    # Every month body is the week header plus a trailing cell space, so the
+    # panel width (borders and padding included) is known without measuring
+    panel_width = len(_WEEK_HEADER_NUMBERED if show_week_numbers else _WEEK_HEADER) + 1 + 4
+    month_panels = [
+        Panel(
+            create_enhanced_month_calendar(year, m, show_week_numbers, show_holidays=False, today=today),
+            title=_month_name[m],
+            style=quarter_colors[(m - 1) // 3],
+            width=panel_width
+        )
+        for m in range(1, 13)
+    ]
+    
+    # Lay everything out in one flat grid. Each row is a quarter with its label
+    # when the console is wide enough, otherwise months simply flow row by row.
+    label_width = max(len(name) for name in quarter_names)
+    show_quarters = console.width >= label_width + 3 * (panel_width + 1) + 4
+    months_per_row = 3 if show_quarters else max(1, (console.width - 4) // (panel_width + 1))
+    
+    grid = Table.grid(padding=(0, 1))
+    if show_quarters:
+        grid.add_column(vertical="middle")
+    for _ in range(months_per_row):
+        grid.add_column(width=panel_width)
+    
+    for start in range(0, 12, months_per_row):
+        row = month_panels[start:start + months_per_row]
+        if show_quarters:
+            quarter = start // 3
+            row.insert(0, Text(quarter_names[quarter], style=quarter_colors[quarter]))
+        grid.add_row(*row)
+    
     console.print(Panel(
-        Text(f"Calendar for {year}", justify="center", style="bold white on dark_blue"),
+        grid,
+        title=Text(f"Calendar for {year}", style="bold white on dark_blue"),
         style="bright_blue",
         expand=False
     ))
-    
-    quarter_columns = []
-    
-    for quarter, (start_month, color, q_name) in enumerate(zip([1, 4, 7, 10], quarter_colors, quarter_names)):
-        month_panels = []
-        
-        for m in range(start_month, start_month + 3):
-            if m > 12:
-                break
-            
-            calendar_text = create_enhanced_month_calendar(year, m, show_week_numbers, show_holidays=False)
-            panel = Panel(
-                calendar_text, 
-                title=calendar.month_name[m], 
-                style=color,
-                expand=False
-            )
-            month_panels.append(panel)
-        
-        quarter_column = Columns(month_panels, expand=False, padding=(0, 1))
-        quarter_panel = Panel(
-            quarter_column,
-            title=q_name,
-            style=color,
-            expand=False
-        )
-        quarter_columns.append(quarter_panel)
-    
-    # Display quarters in 2x2 grid
-    top_row = Columns([quarter_columns[0], quarter_columns[1]], expand=True)
-    bottom_row = Columns([quarter_columns[2], quarter_columns[3]], expand=True)
-    
-    console.print(top_row)
-    console.print(bottom_row)
 
-def show_weekday_info():
+def show_weekday_info(today: Optional[datetime] = None):
     """Show detailed weekday information."""
-    today = datetime.now()
+    console = _get_console()
+    if today is None:
+        today = _now()
+    weekday = today.weekday()
     
     table = Table(title="📅 Weekday Information", show_header=False, box=None)
     table.add_column("Attribute", style="bold cyan", width=15)
     table.add_column("Value", style="green")
     
-    table.add_row("Today is", f"[bold yellow]{today.strftime('%A')}[/bold yellow]")
-    table.add_row("Weekday Number", f"{today.weekday() + 1} (Monday = 1)")
-    table.add_row("ISO Weekday", f"{today.isoweekday()} (Monday = 1)")
-    table.add_row("Weekend?", "Yes 🎉" if today.weekday() >= 5 else "No 💼")
+    table.add_row("Today is", f"[bold yellow]{_WEEKDAYS[weekday]}[/bold yellow]")
+    table.add_row("Weekday Number", f"{weekday + 1} (Monday = 1)")
+    table.add_row("ISO Weekday", f"{weekday + 1} (Monday = 1)")
+    table.add_row("Weekend?", "Yes 🎉" if weekday >= 5 else "No 💼")
     
     # Show next few days
     table.add_row("", "")
     table.add_row("Next 7 Days", "")
     for i in range(1, 8):
-        future_date = today + timedelta(days=i)
-        day_name = future_date.strftime("%A")
-        is_weekend = " 🎉" if future_date.weekday() >= 5 else ""
+        future_weekday = (weekday + i) % 7
+        day_name = _WEEKDAYS[future_weekday]
+        is_weekend = " 🎉" if future_weekday >= 5 else ""
         table.add_row(f"  +{i} day{'s' if i > 1 else ''}", f"{day_name}{is_weekend}")
     
     console.print(table)
 
+WORLD_CLOCK_ZONES = (
+    ("Local", None),
+    ("UTC", "UTC"),
+    ("New York", "America/New_York"),
+    ("Los Angeles", "America/Los_Angeles"),
+    ("London", "Europe/London"),
+    ("Paris", "Europe/Paris"),
+    ("Tokyo", "Asia/Tokyo"),
+    ("Sydney", "Australia/Sydney"),
+    ("Bangkok", "Asia/Bangkok"),
+    ("Dubai", "Asia/Dubai"),
+)
+
+@lru_cache(maxsize=None)
+def get_world_clock_zones() -> Tuple[Tuple[str, Optional[ZoneInfo], Optional[str]], ...]:
+    """Resolve the world clock zones once, keeping any lookup error per location."""
+    zones = []
+    for location, tz_name in WORLD_CLOCK_ZONES:
+        try:
+            zones.append((location, ZoneInfo(tz_name) if tz_name else None, None))
+        except Exception as e:
+            zones.append((location, None, str(e)))
+    return tuple(zones)
+
 def show_time_zones():
     """Show current time in various time zones."""
-    now = datetime.now()
-    
-    timezones = [
-        ("Local", None),
-        ("UTC", "UTC"),
-        ("New York", "America/New_York"),
-        ("Los Angeles", "America/Los_Angeles"),
-        ("London", "Europe/London"),
-        ("Paris", "Europe/Paris"),
-        ("Tokyo", "Asia/Tokyo"),
-        ("Sydney", "Australia/Sydney"),
-        ("Bangkok", "Asia/Bangkok"),
-        ("Dubai", "Asia/Dubai"),
-    ]
+    console = _get_console()
+    now = _now()
     
     table = Table(title="🌍 World Clock", show_header=True, header_style="bold magenta")
     table.add_column("Location", style="cyan", width=12)
     table.add_column("Time", style="green", width=20)
     table.add_column("Date", style="yellow", width=15)
     
-    for location, tz_name in timezones:
-        try:
-            if tz_name:
-                tz = ZoneInfo(tz_name)
-                local_time = now.astimezone(tz)
-            else:
-                local_time = now
-            
-            time_str = local_time.strftime("%H:%M:%S")
-            date_str = local_time.strftime("%Y-%m-%d")
-            
-            table.add_row(location, time_str, date_str)
-        except Exception as e:
-            table.add_row(location, "Error", str(e))
+    for location, tz, error in get_world_clock_zones():
+        if error is not None:
+            table.add_row(location, "Error", error)
+            continue
+        
+        local_time = now.astimezone(tz) if tz else now
+        table.add_row(location, local_time.strftime("%H:%M:%S"), local_time.strftime("%Y-%m-%d"))
     
     console.print(table)
 
@@ -588,43 +640,54 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     
     return parser
 
+# YYYY-MM-DD / YYYY/MM/DD, the dashed form optionally followed by HH:MM[:SS]
+_YMD_RE = re.compile(r"(\d{4})([-/])(\d{1,2})\2(\d{1,2})(?: (\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?")
+# DD/MM/YYYY or MM/DD/YYYY (day-first wins when both are valid)
+_DMY_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
 def parse_date_string(date_str: str) -> Optional[datetime]:
     """Parse various date string formats."""
-    formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d", 
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M",
-    ]
-    
-    for fmt in formats:
+    match = _YMD_RE.fullmatch(date_str)
+    if match:
+        year, sep, month, day, hour, minute, second = match.groups()
+        if hour is not None and sep != "-":
+            return None
         try:
-            return datetime.strptime(date_str, fmt)
+            return datetime(int(year), int(month), int(day),
+                            int(hour or 0), int(minute or 0), int(second or 0))
         except ValueError:
-            continue
+            return None
+    
+    match = _DMY_RE.fullmatch(date_str)
+    if match:
+        first, second, year = (int(g) for g in match.groups())
+        for day, month in ((first, second), (second, first)):
+            try:
+                return datetime(year, month, day)
+            except ValueError:
+                continue
     
     return None
 
+COMMON_TIMEZONES = tuple(sorted([
+    "UTC",
+    "America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles",
+    "America/Toronto", "America/Vancouver", "America/Mexico_City",
+    "Europe/London", "Europe/Paris", "Europe/Berlin", "Europe/Rome", "Europe/Madrid",
+    "Asia/Tokyo", "Asia/Shanghai", "Asia/Seoul", "Asia/Bangkok", "Asia/Dubai",
+    "Asia/Kolkata", "Asia/Singapore", "Asia/Hong_Kong",
+    "Australia/Sydney", "Australia/Melbourne", "Australia/Perth",
+    "Pacific/Auckland", "Pacific/Honolulu",
+    "Africa/Cairo", "Africa/Johannesburg",
+]))
+
 def list_timezones():
     """List some common timezones."""
-    common_timezones = [
-        "UTC",
-        "America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles",
-        "America/Toronto", "America/Vancouver", "America/Mexico_City",
-        "Europe/London", "Europe/Paris", "Europe/Berlin", "Europe/Rome", "Europe/Madrid",
-        "Asia/Tokyo", "Asia/Shanghai", "Asia/Seoul", "Asia/Bangkok", "Asia/Dubai",
-        "Asia/Kolkata", "Asia/Singapore", "Asia/Hong_Kong",
-        "Australia/Sydney", "Australia/Melbourne", "Australia/Perth",
-        "Pacific/Auckland", "Pacific/Honolulu",
-        "Africa/Cairo", "Africa/Johannesburg",
-    ]
-    
+    console = _get_console()
     table = Table(title="Common Timezones", show_header=False)
     table.add_column("Timezone", style="cyan")
     
-    for tz in sorted(common_timezones):
+    for tz in COMMON_TIMEZONES:
         table.add_row(tz)
     
     console.print(table)
@@ -642,46 +705,52 @@ def main(argv=None):
         list_timezones()
         return
     
+    # Read the clock once so every view describes the same instant
+    now = _now()
+    
     # Parse specific date if provided
     target_date = None
     if args.date:
         target_date = parse_date_string(args.date)
         if target_date is None:
+            console = _get_console()
             console.print(f"[red]Error: Could not parse date '{args.date}'[/]")
             console.print("[yellow]Supported formats: YYYY-MM-DD, YYYY/MM/DD, DD/MM/YYYY, MM/DD/YYYY[/]")
             sys.exit(1)
     
     # Determine what to show
-    show_something = False
-    
-    if args.full_year:
-        show_full_year_calendar(year=args.year, show_week_numbers=args.week_numbers)
-        show_something = True
-    
-    if args.calendar:
-        show_calendar(
-            year=args.year, 
-            month=args.month, 
-            show_week_numbers=args.week_numbers,
-            show_holidays=not args.no_holidays
-        )
-        show_something = True
-    
-    if args.weekday:
-        show_weekday_info()
-        show_something = True
+    show_something = any((args.full_year, args.calendar, args.weekday, args.world_clock, args.detailed))
     
-    if args.world_clock:
-        show_time_zones()
-        show_something = True
-    
-    if args.detailed:
-        show_detailed_date_info(target_date, args.timezone)
-        show_something = True
+    if show_something:
+        # Buffer every requested view so it all reaches the terminal in one write
+        with _get_console():
+            if args.full_year:
+                show_full_year_calendar(year=args.year, show_week_numbers=args.week_numbers)
+            
+            if args.calendar:
+                show_calendar(
+                    year=args.year, 
+                    month=args.month, 
+                    show_week_numbers=args.week_numbers,
+                    show_holidays=not args.no_holidays
+                )
+            
+            if args.weekday:
+                show_weekday_info(now)
+            
+            if args.world_clock:
+                show_time_zones()
+            
+            if args.detailed:
+                show_detailed_date_info(target_date or now, args.timezone)
     
     if args.now or not show_something:
-        date_output = format_date_output(args.format, target_date, args.timezone)
-        console.print(date_output)
+        date_output = format_date_output(args.format, target_date or now, args.timezone)
+        if args.format in PLAIN_FORMATS:
+            # Unstyled formats are meant for scripts; skip Rich entirely
+            print(date_output)
+        else:
+            _get_console().print(date_output)
 
 if __name__ == "__main__":
     main()
@@ -5,23 +5,22 @@ A powerful tool for displaying directory structures with icons, filtering, and r
 """
 
 import os
+import re
 import sys
 import argparse
 import stat
+import heapq
+import time
+import fnmatch
 from pathlib import Path
-from typing import Optional, Dict, Set, List
-from dataclasses import dataclass
-from datetime import datetime
-
-try:
-    import pathspec  # for .gitignore support
-    PATHSPEC_AVAILABLE = True
-except ImportError:
-    PATHSPEC_AVAILABLE = False
-    print("Warning: pathspec not available. Install with: pip install pathspec")
+from typing import Callable, Optional, Dict, Set, List, Tuple, Union
+from dataclasses import dataclass, field
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import lru_cache
 
 from rich.console import Console
-from rich.tree import Tree
+from rich.markup import escape
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
@@ -29,6 +28,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Thread count for --parallel; scandir/stat release the GIL, so threads overlap I/O
+PARALLEL_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration and File Type Mappings
 # ─────────────────────────────────────────────────────────────────────────────
@@ -44,7 +46,7 @@ class TreeStats:
     
     def __post_init__(self):
         if self.file_types is None:
-            self.file_types = {}
+            self.file_types = defaultdict(int)
 
 class FileTypeConfig:
     """File type mappings and icons."""
@@ -163,8 +165,6 @@ class FileTypeConfig:
         '.gz': ('📦', 'bright_cyan', 'Gzip'),
         '.bz2': ('📦', 'blue', 'Bzip2'),
         '.xz': ('📦', 'bright_blue', 'XZ Archive'),
-        '.deb': ('📦', 'red', 'Debian Package'),
-        '.rpm': ('📦', 'bright_red', 'RPM Package'),
         '.dmg': ('📦', 'magenta', 'macOS Disk Image'),
         '.iso': ('💿', 'purple', 'ISO Image'),
         '.img': ('💿', 'bright_purple', 'Disk Image'),
@@ -205,98 +205,248 @@ class FileTypeConfig:
     }
     
     @classmethod
+    @lru_cache(maxsize=1)
     def get_all_mappings(cls) -> Dict[str, tuple]:
-        """Get combined mapping of all file types."""
-        mappings = {}
-        for category in [cls.PROGRAMMING, cls.DATA_CONFIG, cls.DOCUMENTS, 
-                        cls.MEDIA, cls.ARCHIVES, cls.EXECUTABLES, cls.SPECIAL]:
-            mappings.update(category)
-        return mappings
+        """Get combined mapping of all file types (built once, treat as read-only)."""
+        return {**cls.PROGRAMMING, **cls.DATA_CONFIG, **cls.DOCUMENTS, **cls.MEDIA,
+                **cls.ARCHIVES, **cls.EXECUTABLES, **cls.SPECIAL}
     
     @classmethod
-    def get_file_info(cls, file_path: Path) -> tuple:
-        """Get icon, color, and description for a file."""
-        mappings = cls.get_all_mappings()
-        suffix = file_path.suffix.lower()
-        name_lower = file_path.name.lower()
-        
-        # Check by suffix first
-        if suffix in mappings:
-            return mappings[suffix]
-        
-        # Check by full name (for files like 'Dockerfile', 'Makefile')
-        if name_lower in mappings:
-            return mappings[name_lower]
-        
-        # Default fallback
-        return ('🗄️', 'white', 'File')
+    def get_file_info(cls, name_lower: str, suffix_lower: str) -> tuple:
+        """Get icon, color, and description for a file from its lowercase name and suffix."""
+        return _lookup_file_info(suffix_lower, name_lower)
+
+# Lookup tables built once from the combined mapping (later categories win on
+# duplicate keys). Dotted keys are suffixes, but also whole dotfile names like
+# '.gitignore'; the rest are whole names like 'dockerfile'.
+_FILE_TYPES_BY_SUFFIX = {k: v for k, v in FileTypeConfig.get_all_mappings().items() if k.startswith('.')}
+_FILE_TYPES_BY_NAME = {k: v for k, v in FileTypeConfig.get_all_mappings().items() if not k.startswith('.')}
+DEFAULT_FILE_INFO = ('🗄️', 'white', 'File')
+
+def _lookup_file_info(suffix: str, name_lower: str) -> tuple:
+    """Look up file type info by lowercase suffix, then by lowercase name."""
+    # Check by suffix first, then by full name (for files like 'Dockerfile', 'Makefile')
+    if suffix:
+        info = _FILE_TYPES_BY_SUFFIX.get(suffix)
+        if info is not None:
+            return info
+    names = _FILE_TYPES_BY_SUFFIX if name_lower.startswith('.') else _FILE_TYPES_BY_NAME
+    return names.get(name_lower, DEFAULT_FILE_INFO)
+
+# Opening and closing label markup for each file type, so labels are joined, not formatted
+_FILE_LABEL_MARKUP = {
+    info: (f"{info[0]} [{info[1]}]", f"[/{info[1]}]")
+    for info in (*_FILE_TYPES_BY_SUFFIX.values(), *_FILE_TYPES_BY_NAME.values(), DEFAULT_FILE_INFO)
+}
+
+def _name_suffix(name: str) -> str:
+    """Return the final suffix of a file name, matching Path.suffix."""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ''
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Utility Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format."""
-    if size_bytes == 0:
-        return "0 B"
-    
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    size_idx = 0
-    size = float(size_bytes)
-    
-    while size >= 1024.0 and size_idx < len(size_names) - 1:
-        size /= 1024.0
-        size_idx += 1
-    
-    if size_idx == 0:
-        return f"{int(size)} {size_names[size_idx]}"
-    else:
-        return f"{size:.1f} {size_names[size_idx]}"
+    # Each unit is 2**10 times the last, so the bit length picks the unit directly
+    size_idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+    if size_idx <= 0:
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << (10 * size_idx)):.1f} {_SIZE_NAMES[size_idx]}"
+
+# Permission strings for every combination of the 12 mode bits stat.filemode shows
+# (rwx plus setuid/setgid/sticky), without the leading file type character
+_PERMISSION_STRINGS = tuple(stat.filemode(bits)[1:] for bits in range(0o10000))
+
+def format_permissions(mode: int) -> str:
+    """Format the permission bits of a st_mode as an rwx string."""
+    return _PERMISSION_STRINGS[mode & 0o7777]
 
 def get_file_permissions(file_path: Path) -> str:
     """Get file permissions as a string."""
     try:
-        mode = file_path.stat().st_mode
-        perms = []
-        
-        # Owner permissions
-        perms.append('r' if mode & stat.S_IRUSR else '-')
-        perms.append('w' if mode & stat.S_IWUSR else '-')
-        perms.append('x' if mode & stat.S_IXUSR else '-')
-        
-        # Group permissions
-        perms.append('r' if mode & stat.S_IRGRP else '-')
-        perms.append('w' if mode & stat.S_IWGRP else '-')
-        perms.append('x' if mode & stat.S_IXGRP else '-')
-        
-        # Other permissions
-        perms.append('r' if mode & stat.S_IROTH else '-')
-        perms.append('w' if mode & stat.S_IWOTH else '-')
-        perms.append('x' if mode & stat.S_IXOTH else '-')
-        
-        return ''.join(perms)
+        return format_permissions(file_path.stat().st_mode)
     except (OSError, PermissionError):
         return "?????????"
 
-def load_gitignore_patterns(gitignore_path: Path):
-    """Load .gitignore patterns if pathspec is available."""
-    if not PATHSPEC_AVAILABLE:
+def _translate_glob(segment: str) -> Optional[str]:
+    """Translate one gitignore path segment to a regex, or None if it is invalid."""
+    regex = []
+    i, end = 0, len(segment)
+    while i < end:
+        char = segment[i]
+        i += 1
+        if char == '\\':
+            if i == end:
+                return None  # Dangling escape
+            regex.append(re.escape(segment[i]))
+            i += 1
+        elif char == '*':
+            regex.append('[^/]*')
+        elif char == '?':
+            regex.append('[^/]')
+        elif char == '[':
+            # Find the closing bracket; a leading ']' (after any negation) is literal
+            j = i
+            if j < end and segment[j] in '!^':
+                j += 1
+            if j < end and segment[j] == ']':
+                j += 1
+            while j < end and segment[j] != ']':
+                j += 1
+            if j >= end:
+                return None  # Git discards patterns with an unterminated range
+            body = segment[i:j]
+            if body[:1] in ('!', '^'):
+                body = '^' + body[1:]
+            regex.append('[' + body.replace('\\', '\\\\') + ']')
+            i = j + 1
+        else:
+            regex.append(re.escape(char))
+    return ''.join(regex)
+
+def _gitignore_line_to_regex(line: str) -> Optional[Tuple[str, bool]]:
+    """Translate a .gitignore line to (regex, is_negated), or None if it matches nothing."""
+    if not line.endswith('\\ '):
+        line = line.rstrip()
+    if not line or line.startswith('#') or line == '/':
         return None
+    
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    
+    segments = line.split('/')
+    is_dir_pattern = not segments[-1]
+    
+    # A leading slash anchors to the root; a lone name matches at any depth
+    if not segments[0]:
+        del segments[0]
+    elif len(segments) == 1 or (len(segments) == 2 and not segments[1]):
+        if segments[0] != '**':
+            segments.insert(0, '**')
+    if not segments:
+        return None
+    
+    # A trailing slash matches everything inside the directory
+    if not segments[-1]:
+        segments[-1] = '**'
+    segments = [seg for k, seg in enumerate(segments)
+                if not (k and seg == '**' and segments[k - 1] == '**')]
+    
+    if segments == ['**'] or segments == ['**', '*']:
+        return ('/' if is_dir_pattern and segments == ['**'] else '.'), negated
+    if segments == ['**', '*', '**']:
+        return '/', negated
+    
+    parts = []
+    need_slash = False
+    last = len(segments) - 1
+    for k, seg in enumerate(segments):
+        if seg == '**':
+            if k == 0:
+                parts.append('^(?:.+/)?')
+            elif k < last:
+                parts.append('(?:/.+)?')
+                need_slash = True
+            else:
+                parts.append('/')
+            continue
+        if k == 0:
+            parts.append('^')
+        if need_slash:
+            parts.append('/')
+        if seg == '*':
+            parts.append('[^/]+')
+        else:
+            glob = _translate_glob(seg)
+            if glob is None:
+                return None
+            parts.append(glob)
+        if k == last:
+            parts.append('(?:/|$)')
+        need_slash = True
+    return ''.join(parts), negated
+
+def _compile_gitignore(lines: List[str]) -> Callable[[str], object]:
+    """Compile .gitignore lines into a single predicate over relative paths."""
+    rules = []
+    for line in lines:
+        translated = _gitignore_line_to_regex(line)
+        if translated is not None:
+            regex, negated = translated
+            rules.append((f"(?:{regex})", negated))
+    
+    positive = [regex for regex, negated in rules if not negated]
+    negative = [regex for regex, negated in rules if negated]
+    if not positive:
+        return lambda path: False
+    
+    first_negative = next((i for i, (_, negated) in enumerate(rules) if negated), len(rules))
+    if all(negated for _, negated in rules[first_negative:]):
+        # Every negated rule comes after every positive one, so the last match is a
+        # negation exactly when any negation matches: two merged regexes decide it
+        search = re.compile("|".join(positive)).search
+        if negative:
+            negative_search = re.compile("|".join(negative)).search
+            match = lambda path: search(path) and not negative_search(path)
+        else:
+            match = search
+    else:
+        # Rules are interleaved, so the last matching rule wins, as in git
+        ordered = [(re.compile(regex).search, negated) for regex, negated in reversed(rules)]
         
+        def match(path: str) -> bool:
+            for search, negated in ordered:
+                if search(path):
+                    return not negated
+            return False
+    
+    if os.sep != "/":
+        return lambda path: match(path.replace(os.sep, "/"))
+    return match
+
+@lru_cache(maxsize=16)
+def _load_gitignore_matcher(path: str, mtime_ns: int, size: int) -> Callable[[str], object]:
+    """Read and compile a .gitignore file, cached per path, modification time and size."""
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return _compile_gitignore(f.read().splitlines())
+
+def load_gitignore_patterns(gitignore_path: Path) -> Optional[Callable[[str], object]]:
+    """Load .gitignore patterns as a path matcher."""
     if not gitignore_path.exists():
         return None
     
     try:
-        with gitignore_path.open("r", encoding="utf-8", errors="ignore") as f:
-            lines = f.read().splitlines()
-        return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+        file_stat = gitignore_path.stat()
+        return _load_gitignore_matcher(str(gitignore_path), file_stat.st_mtime_ns, file_stat.st_size)
     except (OSError, PermissionError) as e:
         console.print(f"[yellow]Warning: Could not read .gitignore file: {e}[/]")
         return None
 
-def should_ignore_path(path: Path, ignore_patterns: Set[str], ignore_hidden: bool) -> bool:
-    """Check if a path should be ignored based on various criteria."""
-    name = path.name.lower()
+@lru_cache(maxsize=8)
+def _compile_ignore_patterns(ignore_patterns: frozenset) -> Callable[[str], object]:
+    """Compile ignore patterns into a single regex search.
+    
+    Glob patterns such as '*.pyc' must match the whole name; any other
+    pattern matches anywhere inside it.
+    """
+    parts = []
+    for pattern in ignore_patterns:
+        if any(char in pattern for char in '*?['):
+            parts.append(f"^(?:{fnmatch.translate(pattern)})")
+        else:
+            parts.append(re.escape(pattern))
+    return re.compile("|".join(parts)).search
+
+def should_ignore_path(name: str, ignore_patterns: Set[str], ignore_hidden: bool) -> bool:
+    """Check if an entry should be ignored based on various criteria (name must be lowercase)."""
     
     # Hidden files/directories
     if ignore_hidden and name.startswith('.'):
@@ -307,10 +457,11 @@ def should_ignore_path(path: Path, ignore_patterns: Set[str], ignore_hidden: boo
         if name in ignore_patterns:
             return True
         
-        # Check for pattern matches
-        for pattern in ignore_patterns:
-            if pattern in name:
-                return True
+        # Check for pattern matches in one pass over the name
+        if not isinstance(ignore_patterns, frozenset):
+            ignore_patterns = frozenset(ignore_patterns)
+        if _compile_ignore_patterns(ignore_patterns)(name):
+            return True
     
     return False
 
@@ -318,131 +469,419 @@ def should_ignore_path(path: Path, ignore_patterns: Set[str], ignore_hidden: boo
 # Tree Building Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _entry_sort_key(item: tuple) -> tuple:
+    """Sort directories first, then files, both alphabetically ignoring case."""
+    return (not item[2], item[1])
+
+def _is_hidden(name: str) -> bool:
+    """Check for dotfiles and dot-directories (this also covers .git)."""
+    return name.startswith('.')
+
+def _escape_markup(text: str) -> str:
+    """Escape plain label text that ends right before a closing tag.
+    
+    Labels are joined and parsed as one markup string, so a name such as
+    '[bold]x' must not open a tag that spills into the following rows. A
+    trailing backslash is doubled so it does not escape the tag after it.
+    """
+    if "[" in text or text.endswith("\\"):
+        return escape(text)
+    return text
+
+def _directory_label(name: str, size: Optional[int]) -> str:
+    """Format a directory node label with its size."""
+    size_text = "size unknown" if size is None else format_file_size(size)
+    return f"📁 [bold blue]{_escape_markup(f'{name} ({size_text})')}[/bold blue]"
+
+def _directory_size(directory: str, base_len: int,
+                    ignore_match: Optional[Callable[[str], object]],
+                    ignore_patterns: Optional[Set[str]], show_hidden: bool) -> int:
+    """Sum the files below a directory that the walk does not descend into.
+    
+    Hidden and ignored entries are skipped as in _scan_directory, so the size
+    is the same as if the walk had listed the directory. Symlinked
+    directories are not followed, since there is no depth limit here.
+    """
+    total = 0
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                name = entry.name
+                if not show_hidden and _is_hidden(name):
+                    continue
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if _is_excluded(entry, name.lower(), is_dir, base_len, ignore_match, ignore_patterns, show_hidden):
+                    continue
+                if is_dir:
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
+
+def _is_excluded(entry: os.DirEntry, name_lower: str, is_dir: bool, base_len: int,
+                 ignore_match: Optional[Callable[[str], object]],
+                 ignore_patterns: Optional[Set[str]], show_hidden: bool) -> bool:
+    """Check an entry against the ignore patterns and the .gitignore rules."""
+    if ignore_patterns and should_ignore_path(name_lower, ignore_patterns, not show_hidden):
+        return True
+    
+    # A directory is matched with a trailing slash so directory-only
+    # rules prune it before it is ever scanned
+    if ignore_match:
+        rel_path = entry.path[base_len:]
+        if ignore_match(rel_path + "/" if is_dir else rel_path):
+            return True
+    
+    return False
+
+def _scan_directory(directory: str, base_len: int,
+                    ignore_match: Optional[Callable[[str], object]],
+                    ignore_patterns: Optional[Set[str]], show_hidden: bool) -> List[tuple]:
+    """List the entries of a directory that are shown, in display order.
+    
+    Each item is (entry, lowercase name, is_dir); filtering here means the
+    walk knows the final children of a directory as soon as it is scanned.
+    """
+    items = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            
+            # Drop hidden entries up front so they are never sorted or matched
+            if not show_hidden and _is_hidden(name):
+                continue
+            
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            
+            # Lowercase the name once for the ignore checks, sorting, stats and type lookup
+            name_lower = name.lower()
+            if _is_excluded(entry, name_lower, is_dir, base_len, ignore_match, ignore_patterns, show_hidden):
+                continue
+            items.append((entry, name_lower, is_dir))
+    
+    items.sort(key=_entry_sort_key)
+    return items
+
+class GuidedNode:
+    """Base for tree nodes that draw their own box-drawing guides.
+    
+    Subclasses provide the add() and label that build_tree uses. Picking
+    the guide for a child needs the node's number of children, which
+    _push_directory sets once the directory has been scanned and filtered.
+    """
+    
+    __slots__ = ("prefix", "remaining")
+    
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self.remaining = 0
+    
+    def _next_guides(self) -> Tuple[str, str]:
+        """Count off one child and return its row guide and its children's prefix."""
+        self.remaining -= 1
+        if self.remaining <= 0:
+            return self.prefix + "└── ", self.prefix + "    "
+        return self.prefix + "├── ", self.prefix + "│   "
+
+@dataclass
+class TreeRows:
+    """Rendered tree rows as parallel lists of guide prefixes and label markup."""
+    guides: List[str] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+    
+    def render(self) -> str:
+        """Join the rows into one markup string."""
+        return "\n".join([guide + label for guide, label in zip(self.guides, self.labels)])
+
+class FlatTree(GuidedNode):
+    """Collect tree rows into a shared TreeRows table instead of Rich Tree nodes.
+    
+    The whole tree is then printed as one markup string, which Rich renders
+    far faster than a nested Tree. Labels can still change after a row is
+    added, so directory sizes are filled in once their subtree is done.
+    """
+    
+    __slots__ = ("rows", "index")
+    
+    def __init__(self, label: str, rows: Optional[TreeRows] = None, prefix: str = ""):
+        super().__init__(prefix)
+        # A root node starts the table; a child's row was already added by add()
+        if rows is None:
+            rows = TreeRows([""], [label])
+        self.rows = rows
+        self.index = len(rows.labels) - 1
+    
+    @property
+    def label(self) -> str:
+        return self.rows.labels[self.index]
+    
+    @label.setter
+    def label(self, label: str) -> None:
+        self.rows.labels[self.index] = label
+    
+    def add(self, label: str) -> "FlatTree":
+        """Add a child row and return its node."""
+        guide, child_prefix = self._next_guides()
+        self.rows.guides.append(guide)
+        self.rows.labels.append(label)
+        return FlatTree(label, self.rows, child_prefix)
+    
+    def render(self) -> str:
+        """Render the whole tree as one markup string."""
+        return self.rows.render()
+
+class StreamingTree(GuidedNode):
+    """Print tree nodes as they are added instead of keeping them in memory.
+    
+    Labels set after a node is printed, such as directory sizes, are not shown.
+    """
+    
+    __slots__ = ("console", "label")
+    
+    def __init__(self, console: Console, label: str, prefix: str = ""):
+        super().__init__(prefix)
+        self.console = console
+        self.label = label
+    
+    def add(self, label: str) -> "StreamingTree":
+        """Print a child node and return it."""
+        guide, child_prefix = self._next_guides()
+        self.console.print(guide + label, highlight=False, soft_wrap=True)
+        return StreamingTree(self.console, label, child_prefix)
+
+# The node types build_tree adds rows to
+TreeNode = Union[FlatTree, StreamingTree]
+
+class DirectoryPrefetcher:
+    """Scan directories on a thread pool ahead of the tree walk.
+    
+    Each job lists one directory, stats its files and queues its
+    subdirectories, so the walk only has to collect finished listings.
+    DirEntry caches stat results, which lets the stat calls happen in
+    the worker threads while the tree itself is built on one thread.
+    """
+    
+    def __init__(self, executor: Executor, base_len: int,
+                 ignore_match: Optional[Callable[[str], object]],
+                 ignore_patterns: Optional[Set[str]], show_hidden: bool,
+                 max_depth: Optional[int]):
+        self.executor = executor
+        self.base_len = base_len
+        self.ignore_match = ignore_match
+        self.ignore_patterns = ignore_patterns
+        self.show_hidden = show_hidden
+        self.max_depth = max_depth
+        self._pending: Dict[str, Future] = {}
+    
+    def submit(self, directory: str, depth: int) -> None:
+        """Queue a directory for scanning."""
+        self._pending[directory] = self.executor.submit(self._scan, directory, depth)
+    
+    def get(self, directory: str) -> List[tuple]:
+        """Wait for a directory's entries, scanning it here if it was never queued."""
+        future = self._pending.pop(directory, None)
+        if future is None:
+            return self._scan_directory(directory)
+        return future.result()
+    
+    def _scan_directory(self, directory: str) -> List[tuple]:
+        """Scan a directory with the walk's filters."""
+        return _scan_directory(directory, self.base_len, self.ignore_match,
+                               self.ignore_patterns, self.show_hidden)
+    
+    def _scan(self, directory: str, depth: int) -> List[tuple]:
+        """List a directory and queue the subdirectories the walk will descend into."""
+        items = self._scan_directory(directory)
+        descend = self.max_depth is None or depth + 1 < self.max_depth
+        for entry, _, is_dir in items:
+            try:
+                if is_dir:
+                    if descend:
+                        self.submit(entry.path, depth + 1)
+                elif entry.is_file():
+                    entry.stat()
+            except OSError:
+                # The walk reports the error when it reaches the entry
+                pass
+        return items
+
+def _push_directory(stack: List[list], directory: str, node: TreeNode, depth: int,
+                    max_depth: Optional[int], scan: Callable[[str], List[tuple]],
+                    name: Optional[str] = None) -> bool:
+    """Scan a directory and queue its sorted entries for the tree walk.
+    
+    Returns False when the directory is beyond max_depth or cannot be read.
+    """
+    if max_depth is not None and depth >= max_depth:
+        return False
+    
+    try:
+        entries = scan(directory)
+    except PermissionError:
+        node.add("[red]🚫 Permission Denied[/red]")
+        return False
+    except OSError as e:
+        node.add(f"[red]❌ Error: {escape(str(e))}[/red]")
+        return False
+    
+    node.remaining = len(entries)
+    stack.append([node, depth, iter(entries), 0, name])
+    return True
+
 def build_tree(
-    directory: Path, 
-    tree: Tree, 
-    base_path: Path, 
+    directory: str, 
+    tree: TreeNode, 
+    base_len: int, 
     stats: TreeStats,
-    ignore_spec=None,
+    ignore_match: Optional[Callable[[str], object]] = None,
     show_hidden: bool = False,
     show_size: bool = False,
     show_permissions: bool = False,
     show_modified: bool = False,
     max_depth: Optional[int] = None,
     current_depth: int = 0,
-    ignore_patterns: Optional[Set[str]] = None
-) -> None:
-    """Build the directory tree recursively."""
+    ignore_patterns: Optional[Set[str]] = None,
+    prefetcher: Optional[DirectoryPrefetcher] = None
+) -> int:
+    """Build the directory tree depth-first using an explicit stack.
     
-    if max_depth is not None and current_depth >= max_depth:
-        return
+    base_len is the length of the root directory path including its trailing
+    separator; slicing an entry path by it yields the root-relative path.
     
-    try:
-        paths = list(directory.iterdir())
-        # Sort directories first, then files, both alphabetically
-        paths.sort(key=lambda p: (not p.is_dir(), p.name.lower()))
+    With a prefetcher, directory listings and file stats are read on its
+    thread pool; the tree and statistics are still built in walk order.
+    tree is a FlatTree, or a StreamingTree to print rows as they are found.
+    
+    Returns the total size of the files listed under the directory. With
+    show_size, directory labels get their size once their subtree is done.
+    """
+    
+    if prefetcher:
+        scan = prefetcher.get
+        prefetcher.submit(directory, current_depth)
+    else:
+        def scan(path: str) -> List[tuple]:
+            return _scan_directory(path, base_len, ignore_match, ignore_patterns, show_hidden)
+    
+    # Each frame is [tree node, depth, iterator over the directory's shown entries,
+    # bytes seen so far, directory name]; ignored and hidden entries are already
+    # filtered out by the scan. The starting frame has no name.
+    stack: List[list] = []
+    total_size = 0
+    _push_directory(stack, directory, tree, current_depth, max_depth, scan)
+    
+    # The loop body runs once per entry, so keep its lookups local
+    file_types = stats.file_types
+    largest_size = stats.largest_file[1] if stats.largest_file else -1
+    
+    while stack:
+        frame = stack[-1]
+        node, depth, entries = frame[0], frame[1], frame[2]
+        item = next(entries, None)
+        if item is None:
+            # Post-order: the subtree is complete, so its size is final
+            stack.pop()
+            if frame[4] is None:
+                total_size += frame[3]
+            else:
+                if show_size:
+                    node.label = _directory_label(frame[4], frame[3])
+                stack[-1][3] += frame[3]
+            continue
         
-        for path in paths:
-            # Skip hidden files unless explicitly requested
-            if not show_hidden and path.name.startswith('.'):
-                continue
-            
-            # Check ignore patterns
-            if ignore_patterns and should_ignore_path(path, ignore_patterns, not show_hidden):
-                continue
-            
-            # Handle gitignore patterns
-            if ignore_spec:
-                try:
-                    relative_path = path.relative_to(base_path)
-                    if ignore_spec.match_file(str(relative_path)):
-                        continue
-                except ValueError:
-                    # Path is not relative to base_path
-                    continue
-            
-            display_parts = [path.name]
+        try:
+            entry, name_lower, is_dir = item
+            name = entry.name
             
-            if path.is_dir():
+            if is_dir:
                 stats.total_dirs += 1
                 
-                # Add directory size if requested
-                if show_size:
-                    try:
-                        dir_size = sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
-                        display_parts.append(f"({format_file_size(dir_size)})")
-                    except (OSError, PermissionError):
-                        display_parts.append("(size unknown)")
+                # The size is filled into the label once the subtree is done
+                branch = node.add(f"📁 [bold blue]{_escape_markup(name)}[/bold blue]")
                 
-                display_name = " ".join(display_parts)
-                branch = tree.add(f"📁 [bold blue]{display_name}[/bold blue]")
-                
-                # Recursively build subdirectory
-                build_tree(
-                    path, branch, base_path, stats, ignore_spec, 
-                    show_hidden, show_size, show_permissions, show_modified,
-                    max_depth, current_depth + 1, ignore_patterns
-                )
+                if max_depth is not None and depth + 1 >= max_depth:
+                    # Not shown below the depth limit, so sum it separately
+                    if show_size:
+                        try:
+                            dir_size = _directory_size(entry.path, base_len, ignore_match,
+                                                       ignore_patterns, show_hidden)
+                        except (OSError, PermissionError):
+                            dir_size = None
+                        else:
+                            frame[3] += dir_size
+                        branch.label = _directory_label(name, dir_size)
+                # Descend before the remaining siblings, keeping depth-first order
+                elif not _push_directory(stack, entry.path, branch, depth + 1, max_depth,
+                                         scan, name) and show_size:
+                    branch.label = _directory_label(name, None)
                 
-            elif path.is_file():
+            elif entry.is_file():
                 stats.total_files += 1
+                suffix = _name_suffix(name_lower)
                 
                 try:
-                    file_stat = path.stat()
+                    file_stat = entry.stat()
                     file_size = file_stat.st_size
                     stats.total_size += file_size
+                    frame[3] += file_size
                     
                     # Track file types
-                    suffix = path.suffix.lower() or 'no extension'
-                    stats.file_types[suffix] = stats.file_types.get(suffix, 0) + 1
+                    file_types[suffix or 'no extension'] += 1
                     
                     # Track largest file
-                    if stats.largest_file is None or file_size > stats.largest_file[1]:
-                        stats.largest_file = (str(path), file_size)
+                    if file_size > largest_size:
+                        largest_size = file_size
+                        stats.largest_file = (entry.path, file_size)
                     
-                    # Get file type info
-                    icon, color, file_type = FileTypeConfig.get_file_info(path)
+                    display_name = name
                     
                     # Add size information
                     if show_size:
-                        display_parts.append(f"({format_file_size(file_size)})")
+                        display_name += f" ({format_file_size(file_size)})"
                     
                     # Add permissions
                     if show_permissions:
-                        perms = get_file_permissions(path)
-                        display_parts.append(f"[{perms}]")
+                        display_name += f" [{format_permissions(file_stat.st_mode)}]"
                     
                     # Add modification time
                     if show_modified:
-                        mtime = datetime.fromtimestamp(file_stat.st_mtime)
-                        display_parts.append(f"({mtime.strftime('%Y-%m-%d %H:%M')})")
+                        mtime = time.strftime('%Y-%m-%d %H:%M', time.localtime(file_stat.st_mtime))
+                        display_name += f" ({mtime})"
                     
-                    display_name = " ".join(display_parts)
-                    tree.add(f"{icon} [{color}]{display_name}[/{color}]")
+                    # Wrap in the file type's icon and color
+                    markup_open, markup_close = _FILE_LABEL_MARKUP[_lookup_file_info(suffix, name_lower)]
+                    node.add(markup_open + _escape_markup(display_name) + markup_close)
                     
                 except (OSError, PermissionError):
                     # Handle files we can't access
-                    icon, color, _ = FileTypeConfig.get_file_info(path)
-                    display_name = f"{path.name} [red](access denied)[/red]"
-                    tree.add(f"{icon} [{color}]{display_name}[/{color}]")
+                    markup_open, markup_close = _FILE_LABEL_MARKUP[_lookup_file_info(suffix, name_lower)]
+                    node.add(f"{markup_open}{_escape_markup(name + ' ')}[red](access denied)[/red]{markup_close}")
                     
             else:
                 # Handle special files (symlinks, etc.)
                 try:
-                    if path.is_symlink():
-                        target = path.readlink()
-                        tree.add(f"🔗 [cyan]{path.name}[/cyan] → [dim]{target}[/dim]")
+                    if entry.is_symlink():
+                        target = os.readlink(entry.path)
+                        node.add(f"🔗 [cyan]{_escape_markup(name)}[/cyan] → [dim]{_escape_markup(target)}[/dim]")
                     else:
-                        tree.add(f"❓ [dim]{path.name}[/dim]")
+                        node.add(f"❓ [dim]{_escape_markup(name)}[/dim]")
                 except (OSError, PermissionError):
-                    tree.add(f"❓ [dim red]{path.name} (access denied)[/dim red]")
+                    node.add(f"❓ [dim red]{_escape_markup(name + ' (access denied)')}[/dim red]")
                     
-    except PermissionError:
-        tree.add("[red]🚫 Permission Denied[/red]")
-    except OSError as e:
-        tree.add(f"[red]❌ Error: {e}[/red]")
+        except PermissionError:
+            node.add("[red]🚫 Permission Denied[/red]")
+            frame[2] = iter(())
+        except OSError as e:
+            node.add(f"[red]❌ Error: {escape(str(e))}[/red]")
+            frame[2] = iter(())
+    
+    return total_size
 
-def show_statistics(stats: TreeStats, root_path: Path) -> None:
+def show_statistics(stats: TreeStats, root_path: str) -> None:
     """Display tree statistics in a nice table."""
     table = Table(title="Directory Statistics", show_header=True, header_style="bold magenta")
     table.add_column("Metric", style="cyan", no_wrap=True)
@@ -453,14 +892,13 @@ def show_statistics(stats: TreeStats, root_path: Path) -> None:
     table.add_row("Total Size", format_file_size(stats.total_size))
     
     if stats.largest_file:
-        largest_name = Path(stats.largest_file[0]).name
+        largest_name = os.path.basename(stats.largest_file[0])
         largest_size = format_file_size(stats.largest_file[1])
-        table.add_row("Largest File", f"{largest_name} ({largest_size})")
+        table.add_row("Largest File", _escape_markup(f"{largest_name} ({largest_size})"))
     
     # Show top file types
     if stats.file_types:
-        sorted_types = sorted(stats.file_types.items(), key=lambda x: x[1], reverse=True)
-        top_types = sorted_types[:3]  # Show top 3
+        top_types = heapq.nlargest(3, stats.file_types.items(), key=lambda x: x[1])  # Show top 3
         type_str = ", ".join([f"{ext} ({count})" for ext, count in top_types])
         table.add_row("Top File Types", type_str)
     
@@ -481,6 +919,8 @@ def setup_argument_parser() -> argparse.ArgumentParser:
   ppc treeview --use-gitignore .gitignore  # Use .gitignore filtering
   ppc treeview --max-depth 2            # Limit depth to 2 levels
   ppc treeview --show-size --show-permissions  # Show detailed info
+  ppc treeview --parallel /big/repo     # Scan directories in parallel
+  ppc treeview --stream /huge/tree      # Print entries as they are found
         """,
         formatter_class=argparse.RawTextHelpFormatter
     )
@@ -539,7 +979,21 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         "--ignore-patterns",
         nargs="*",
         metavar="PATTERN",
-        help="Additional patterns to ignore (e.g., '*.pyc' '__pycache__')"
+        help="Additional patterns to ignore; globs like '*.pyc' match whole names,\n"
+             "anything else matches part of a name (e.g., '*.pyc' '__pycache__')"
+    )
+    
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Scan directories on a thread pool ahead of the walk (helps on large or network trees)"
+    )
+    
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print entries as they are found instead of building the whole tree first\n"
+             "(bounded memory for huge trees; directory sizes are not shown)"
     )
     
     parser.add_argument(
@@ -559,71 +1013,83 @@ def main(argv=None):
     args = parser.parse_args(argv)
     
     # Resolve the root directory
-    root_dir = Path(os.path.expandvars(os.path.expanduser(args.directory))).resolve()
+    root_dir = os.path.realpath(os.path.expandvars(os.path.expanduser(args.directory)))
     
-    if not root_dir.exists():
+    if not os.path.exists(root_dir):
         console.print(f"[bold red]❌ Path not found:[/] {root_dir}")
         sys.exit(1)
     
-    if not root_dir.is_dir():
+    if not os.path.isdir(root_dir):
         console.print(f"[bold red]❌ Not a directory:[/] {root_dir}")
         sys.exit(1)
     
     # Handle gitignore patterns
-    ignore_spec = None
+    ignore_match = None
     if args.use_gitignore:
-        if not PATHSPEC_AVAILABLE:
-            console.print("[yellow]⚠️ Warning: pathspec not installed. Install with: pip install pathspec[/]")
-        else:
-            gitignore_path = Path(os.path.expandvars(os.path.expanduser(args.use_gitignore))).resolve()
-            ignore_spec = load_gitignore_patterns(gitignore_path)
-            if ignore_spec is None:
-                console.print(f"[yellow]⚠️ Warning: .gitignore file not found: {gitignore_path}[/]")
+        gitignore_path = Path(os.path.expandvars(os.path.expanduser(args.use_gitignore))).resolve()
+        ignore_match = load_gitignore_patterns(gitignore_path)
+        if ignore_match is None:
+            console.print(f"[yellow]⚠️ Warning: .gitignore file not found: {gitignore_path}[/]")
     
     # Set up ignore patterns
-    ignore_patterns = set()
-    if args.ignore_patterns:
-        ignore_patterns.update(pattern.lower() for pattern in args.ignore_patterns)
+    ignore_patterns = frozenset(pattern.lower() for pattern in args.ignore_patterns or ())
     
     # Initialize statistics
     stats = TreeStats()
     
     # Create the root tree
-    root_display = f"📦 [link file://{root_dir}]{root_dir.name}[/]"
-    if args.show_size:
-        try:
-            with Progress(SpinnerColumn(), TextColumn("Calculating directory size..."), transient=True) as progress:
-                progress.add_task("", total=None)
-                total_size = sum(f.stat().st_size for f in root_dir.rglob('*') if f.is_file())
-            root_display += f" ({format_file_size(total_size)})"
-        except (OSError, PermissionError):
-            root_display += " (size calculation failed)"
-    
-    tree = Tree(root_display)
+    root_name = _escape_markup(os.path.basename(root_dir))
+    if "[" in root_dir or "]" in root_dir:
+        # Brackets cannot appear inside a markup tag, so leave the root unlinked
+        root_display = f"📦 {root_name}"
+    else:
+        root_display = f"📦 [link file://{root_dir}]{root_name}[/]"
+    if args.stream:
+        console.print(root_display, highlight=False)
+        tree = StreamingTree(console, root_display)
+    else:
+        tree = FlatTree(root_display)
     
     # Build the tree
+    base_len = len(os.path.join(root_dir, ""))
+    executor = prefetcher = None
+    if args.parallel:
+        executor = ThreadPoolExecutor(max_workers=PARALLEL_WORKERS)
+        prefetcher = DirectoryPrefetcher(executor, base_len, ignore_match, ignore_patterns,
+                                         args.show_hidden, args.max_depth)
     try:
-        with Progress(SpinnerColumn(), TextColumn("Building directory tree..."), transient=True) as progress:
+        # A spinner would interleave with streamed output
+        with Progress(SpinnerColumn(), TextColumn("Building directory tree..."), transient=True,
+                      disable=args.stream) as progress:
             progress.add_task("", total=None)
-            build_tree(
+            total_size = build_tree(
                 directory=root_dir,
                 tree=tree,
-                base_path=root_dir,
+                base_len=base_len,
                 stats=stats,
-                ignore_spec=ignore_spec,
+                ignore_match=ignore_match,
                 show_hidden=args.show_hidden,
                 show_size=args.show_size,
                 show_permissions=args.show_permissions,
                 show_modified=args.show_modified,
                 max_depth=args.max_depth,
-                ignore_patterns=ignore_patterns
+                ignore_patterns=ignore_patterns,
+                prefetcher=prefetcher
             )
     except KeyboardInterrupt:
         console.print("\n[yellow]Tree building interrupted by user.[/]")
         sys.exit(1)
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+    
+    # The root size is known once the walk has finished
+    if args.show_size:
+        tree.label = f"{root_display} ({format_file_size(total_size)})"
     
     # Display the tree
-    console.print(tree)
+    if not args.stream:
+        console.print(tree.render(), highlight=False, soft_wrap=True)
     
     # Show statistics if requested
     if args.stats:
@@ -13,9 +13,13 @@ import os
 import threading
 import queue
 import random
-from typing import Optional, List, Union, TextIO
+import re
+import select
+import itertools
+from typing import Callable, Optional, List, Union, TextIO
 from pathlib import Path
 import contextlib
+from functools import lru_cache
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Safe Output and Error Handling
@@ -25,70 +29,79 @@ class SafeOutput:
     def __init__(self, output_file: Optional[TextIO] = None, buffer_size: int = 65536):
         self.output_file = output_file or sys.stdout
         self.closed = False
-        self.buffer = []
+        self.buffer = bytearray()
         self.buffer_size = buffer_size
         self.bytes_written = 0
         self.lines_written = 0
+        self.encoding = getattr(self.output_file, 'encoding', None) or 'utf-8'
+        self.errors = getattr(self.output_file, 'errors', None) or 'strict'
+        self._fd = self._raw_fd()
+
+    def _raw_fd(self) -> Optional[int]:
+        """Get the file descriptor to write to directly, bypassing the text layer."""
+        try:
+            # The Windows console needs the text layer to write Unicode
+            if SystemInfo.is_windows() and self.output_file.isatty():
+                return None
+            self.output_file.flush()
+            return self.output_file.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
 
     def write(self, text: str) -> bool:
-        if self.closed:
-            return False
         try:
-            self.buffer.append(text)
-            if sum(len(x) for x in self.buffer) >= self.buffer_size:
-                self._flush_buffer()
-            return True
-        except (BrokenPipeError, OSError, ValueError):
+            return self.write_bytes(text.encode(self.encoding, self.errors))
+        except UnicodeEncodeError:
             self.closed = True
             return False
 
+    def write_bytes(self, data: bytes) -> bool:
+        if self.closed:
+            return False
+        # A full block with nothing queued ahead of it skips the buffer copy
+        if not self.buffer and len(data) >= self.buffer_size:
+            return self._write_out(data)
+        self.buffer += data
+        if len(self.buffer) >= self.buffer_size:
+            return self._flush_buffer()
+        return True
+
     def _flush_buffer(self) -> bool:
         if not self.buffer or self.closed:
             return True
+        content = self.buffer
+        self.buffer = bytearray()
+        return self._write_out(content)
+
+    def _write_out(self, content: bytes) -> bool:
+        """Write bytes to the output, marking it closed on failure."""
         try:
-            content = ''.join(self.buffer)
-            self.output_file.write(content)
-            self.output_file.flush()
+            if self._fd is None:
+                self.output_file.write(content.decode(self.encoding, self.errors))
+                self.output_file.flush()
+            else:
+                # os.write may write less than asked, so loop until it is all out
+                view = memoryview(content)
+                while view:
+                    try:
+                        view = view[os.write(self._fd, view):]
+                    except BlockingIOError:
+                        # Non-blocking descriptor with a full pipe: wait for room
+                        select.select([], [self._fd], [])
             self.bytes_written += len(content)
-            self.lines_written += content.count('\n')
-            self.buffer.clear()
+            self.lines_written += content.count(b'\n')
             return True
         except (BrokenPipeError, OSError, ValueError):
             self.closed = True
             return False
 
-# Optimized yes_worker for infinite output
-def yes_worker(worker_id: int, text: str, count: Union[int, float], delay: float, 
-               quiet: bool, output_file: Optional[str] = None, mode: str = "normal",
-               stats_queue: Optional[queue.Queue] = None) -> None:
-    stats = WorkerStats()
-    try:
-        output = SafeOutput(open(output_file, 'w') if output_file else None)
-        generator = TextGenerator(text, mode)
-
-        i = 0
-        infinite = count == float("inf")
-        while infinite or i < count:
-            if not quiet:
-                generated_text = generator.generate() + "\n"
-                if not output.write(generated_text):
-                    break
-                stats.lines_output += 1
-                stats.bytes_output += len(generated_text)
-
-            i += 1
-            if delay > 0:
-                time.sleep(delay)
-
-        output._flush_buffer()
-        output.close()
-        stats.finish()
-    except KeyboardInterrupt:
-        stats.finish(interrupted=True)
-    finally:
-        if stats_queue:
-            stats_queue.put(('stats', worker_id, stats))
-
+    def close(self) -> None:
+        """Flush any buffered output and close the file if it is not stdout."""
+        self._flush_buffer()
+        self.closed = True
+        if self.output_file not in (sys.stdout, sys.stderr):
+            with contextlib.suppress(OSError):
+                self.output_file.close()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # System Detection and Environment
@@ -98,6 +111,7 @@ class SystemInfo:
     """Detect system environment and capabilities."""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def is_powershell() -> bool:
         """Detect if running inside PowerShell."""
         return (
@@ -108,17 +122,23 @@ class SystemInfo:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def is_windows() -> bool:
         """Check if running on Windows."""
         return os.name == 'nt' or sys.platform.startswith('win')
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _environment_allows_colors() -> bool:
+        """Check the environment variables that disable colors."""
+        return os.environ.get('TERM') != 'dumb' and not os.environ.get('NO_COLOR')
+    
     @staticmethod
     def supports_colors() -> bool:
         """Check if terminal supports colors."""
         return (
             hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
-            and os.environ.get('TERM') != 'dumb'
-            and not os.environ.get('NO_COLOR')
+            and SystemInfo._environment_allows_colors()
         )
     
     @staticmethod
@@ -152,53 +172,96 @@ class TextGenerator:
         self.base_text = text
         self.mode = mode
         self.counter = 0
-    
-    def generate(self) -> str:
-        """Generate the next text based on the mode."""
-        self.counter += 1
+        self._line = text + "\n"
+        self._numbers = itertools.count(1)
+        self._timestamp_second = None
+        self._timestamp_text = ""
         
-        if self.mode == "normal":
-            return self.base_text
-        elif self.mode == "numbered":
-            return f"{self.counter:06d}: {self.base_text}"
-        elif self.mode == "timestamped":
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            return f"[{timestamp}] {self.base_text}"
-        elif self.mode == "random":
-            variations = [
-                self.base_text,
-                self.base_text.upper(),
-                self.base_text.lower(),
-                self.base_text.capitalize(),
-                self.base_text[::-1]  # reversed
-            ]
-            return random.choice(variations)
-        elif self.mode == "progressive":
-            # Add more characters each time
-            length = min(len(self.base_text), self.counter)
-            return self.base_text[:length]
-        else:
-            return self.base_text
+        # Random mode picks from the same handful of variations every time
+        self._variations: tuple = ()
+        self._variation_lines: tuple = ()
+        if mode == "random":
+            self._variations = (
+                text,
+                text.upper(),
+                text.lower(),
+                text.capitalize(),
+                text[::-1]  # reversed
+            )
+            self._variation_lines = tuple(variation + "\n" for variation in self._variations)
+        
+        # Pick the mode's generator once instead of branching on every call
+        generators = {
+            "normal": self._generate_normal,
+            "numbered": self._generate_numbered,
+            "timestamped": self._generate_timestamped,
+            "random": self._generate_random,
+            "progressive": self._generate_progressive,
+        }
+        self.generate: Callable[[], str] = generators.get(mode, self._generate_normal)
+        
+        # The normal line never changes, so skip the newline concatenation too
+        if self.generate == self._generate_normal:
+            self.generate_line = self._generate_normal_line
+        elif self.generate == self._generate_random:
+            self.generate_line = self._generate_random_line
+    
+    def generate_line(self) -> str:
+        """Generate the next text based on the mode, followed by a newline."""
+        return self.generate() + "\n"
+    
+    def _generate_normal(self) -> str:
+        return self.base_text
+    
+    def _generate_normal_line(self) -> str:
+        return self._line
+    
+    def _generate_numbered(self) -> str:
+        return f"{next(self._numbers):06d}: {self.base_text}"
+    
+    def _generate_timestamped(self) -> str:
+        # The text only changes once a second, so format it once per second
+        now = int(time.time())
+        if now != self._timestamp_second:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._timestamp_second = now
+            self._timestamp_text = f"[{timestamp}] {self.base_text}"
+        return self._timestamp_text
+    
+    def _generate_random(self) -> str:
+        return random.choice(self._variations)
+    
+    def _generate_random_line(self) -> str:
+        return random.choice(self._variation_lines)
+    
+    def _generate_progressive(self) -> str:
+        # Add more characters each time
+        self.counter += 1
+        length = min(len(self.base_text), self.counter)
+        return self.base_text[:length]
+
+_ESCAPE_REPLACEMENTS = {
+    '\\n': '\n',
+    '\\t': '\t',
+    '\\r': '\r',
+    '\\\\': '\\',
+    '\\0': '\0',
+}
+_ESCAPE_PATTERN = re.compile(r'\\[ntr\\0]')
 
 def parse_escape_sequences(text: str) -> str:
     """Parse common escape sequences in text."""
-    replacements = {
-        '\\n': '\n',
-        '\\t': '\t',
-        '\\r': '\r',
-        '\\\\': '\\',
-        '\\0': '\0',
-    }
-    
-    for escape, replacement in replacements.items():
-        text = text.replace(escape, replacement)
-    
-    return text
+    # One left-to-right pass, so an escaped backslash never starts another escape
+    return _ESCAPE_PATTERN.sub(lambda m: _ESCAPE_REPLACEMENTS[m.group()], text)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Worker Functions and Process Management
 # ─────────────────────────────────────────────────────────────────────────────
 
+# A sleep costs tens of microseconds whatever it asks for, so shorter delays are
+# added up and slept off together once they reach this many seconds
+MIN_SLEEP = 1e-4
+
 class WorkerStats:
     """Statistics for a worker process/thread."""
     def __init__(self):
@@ -225,8 +288,8 @@ class WorkerStats:
 
 def yes_worker(worker_id: int, text: str, count: Union[int, float], delay: float, 
                quiet: bool, output_file: Optional[str] = None, mode: str = "normal",
-               stats_queue: Optional[queue.Queue] = None) -> None:
-    """Worker function that generates repeated text output."""
+               stats_queue: Optional[queue.Queue] = None) -> WorkerStats:
+    """Worker function that generates repeated text output, returning its stats."""
     
     stats = WorkerStats()
     
@@ -240,26 +303,55 @@ def yes_worker(worker_id: int, text: str, count: Union[int, float], delay: float
         # Setup text generator
         generator = TextGenerator(text, mode)
         
-        # Main output loop
-        i = 0
-        while i < count:
-            if not quiet:
-                generated_text = generator.generate() + "\n"
-                if not output.write(generated_text):
+        # Normal mode repeats the same line, so encode it once
+        line_bytes = None
+        if mode == "normal":
+            line_bytes = (text + "\n").encode(output.encoding, output.errors)
+        
+        # Normal mode without a delay is pure throughput: write whole blocks of
+        # lines at a time instead of going round the loop once per line
+        if line_bytes is not None and delay == 0 and not quiet:
+            reps = max(1, output.buffer_size // len(line_bytes))
+            block = line_bytes * reps
+            remaining = count
+            while remaining > 0:
+                if remaining < reps:
+                    reps = int(remaining)
+                    block = line_bytes * reps
+                if not output.write_bytes(block):
                     break  # Output closed/broken
+                stats.lines_output += reps
+                stats.bytes_output += len(block)
+                remaining -= reps
+        elif quiet and delay == 0 and count != float("inf"):
+            # A finite quiet run writes and sleeps nothing, so there is no loop to run
+            pass
+        else:
+            # Main output loop
+            i = 0
+            owed_delay = 0.0
+            while i < count:
+                if not quiet:
+                    if line_bytes is not None:
+                        if not output.write_bytes(line_bytes):
+                            break  # Output closed/broken
+                        stats.bytes_output += len(line_bytes)
+                    else:
+                        generated_text = generator.generate_line()
+                        if not output.write(generated_text):
+                            break  # Output closed/broken
+                        stats.bytes_output += len(generated_text)
+                    
+                    stats.lines_output += 1
                 
-                stats.lines_output += 1
-                stats.bytes_output += len(generated_text)
-            
-            i += 1
-            
-            # Rate limiting
-            if delay > 0:
-                time.sleep(delay)
-            
-            # Yield control periodically for better responsiveness
-            if i % 1000 == 0:
-                time.sleep(0.001)
+                i += 1
+                
+                # Rate limiting
+                if delay > 0:
+                    owed_delay += delay
+                    if owed_delay >= MIN_SLEEP:
+                        time.sleep(owed_delay)
+                        owed_delay = 0.0
         
         output.close()
         stats.finish()
@@ -273,10 +365,12 @@ def yes_worker(worker_id: int, text: str, count: Union[int, float], delay: float
     finally:
         if stats_queue:
             stats_queue.put(('stats', worker_id, stats))
+    
+    return stats
 
 def threaded_yes_worker(worker_id: int, text: str, count: Union[int, float], 
                        delay: float, quiet: bool, mode: str,
-                       stats_queue: queue.Queue, stop_event: threading.Event) -> None:
+                       stats_list: List[WorkerStats], stop_event: threading.Event) -> None:
     """Thread-based worker for better resource usage."""
     
     stats = WorkerStats()
@@ -285,9 +379,10 @@ def threaded_yes_worker(worker_id: int, text: str, count: Union[int, float],
     
     try:
         i = 0
+        owed_delay = 0.0
         while i < count and not stop_event.is_set():
             if not quiet:
-                generated_text = generator.generate() + "\n"
+                generated_text = generator.generate_line()
                 if not output.write(generated_text):
                     break
                 
@@ -297,23 +392,32 @@ def threaded_yes_worker(worker_id: int, text: str, count: Union[int, float],
             i += 1
             
             if delay > 0:
-                time.sleep(delay)
+                owed_delay += delay
+                if owed_delay >= MIN_SLEEP:
+                    time.sleep(owed_delay)
+                    owed_delay = 0.0
             
             # Check for stop signal more frequently
             if i % 100 == 0 and stop_event.is_set():
                 break
         
+        output.close()
         stats.finish()
         
     except KeyboardInterrupt:
         stats.finish(interrupted=True)
     finally:
-        stats_queue.put(('stats', worker_id, stats))
+        # Each thread appends once on exit; list.append is atomic under the GIL
+        stats_list.append(stats)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Statistics and Monitoring
 # ─────────────────────────────────────────────────────────────────────────────
 
+# GREEN, YELLOW, RED, BLUE, RESET
+_ANSI_COLORS = ('\033[32m', '\033[33m', '\033[31m', '\033[34m', '\033[0m')
+_NO_COLORS = ('',) * len(_ANSI_COLORS)
+
 def print_statistics(worker_stats: List[WorkerStats], total_time: float, 
                     show_colors: bool = False) -> None:
     """Print comprehensive statistics about the yes command execution."""
@@ -327,45 +431,58 @@ def print_statistics(worker_stats: List[WorkerStats], total_time: float,
     interrupted_workers = sum(1 for s in worker_stats if s.interrupted)
     
     # Color codes
-    if show_colors:
-        GREEN = '\033[32m'
-        YELLOW = '\033[33m'
-        RED = '\033[31m'
-        BLUE = '\033[34m'
-        RESET = '\033[0m'
-    else:
-        GREEN = YELLOW = RED = BLUE = RESET = ''
+    GREEN, YELLOW, RED, BLUE, RESET = _ANSI_COLORS if show_colors else _NO_COLORS
     
-    # Print statistics
-    print(f"\n{BLUE}=== Yes Command Statistics ==={RESET}", file=sys.stderr)
-    print(f"{GREEN}Total Lines Output:{RESET} {total_lines:,}", file=sys.stderr)
-    print(f"{GREEN}Total Bytes Output:{RESET} {format_bytes(total_bytes)}", file=sys.stderr)
-    print(f"{GREEN}Total Time:{RESET} {total_time:.3f} seconds", file=sys.stderr)
+    # Build the whole report and write it once
+    parts = [
+        f"\n{BLUE}=== Yes Command Statistics ==={RESET}\n",
+        f"{GREEN}Total Lines Output:{RESET} {total_lines:,}\n",
+        f"{GREEN}Total Bytes Output:{RESET} {format_bytes(total_bytes)}\n",
+        f"{GREEN}Total Time:{RESET} {total_time:.3f} seconds\n",
+    ]
     
     if total_time > 0:
         lines_per_sec = total_lines / total_time
         bytes_per_sec = total_bytes / total_time
-        print(f"{GREEN}Average Rate:{RESET} {lines_per_sec:,.0f} lines/sec, {format_bytes(bytes_per_sec)}/sec", file=sys.stderr)
+        parts.append(f"{GREEN}Average Rate:{RESET} {lines_per_sec:,.0f} lines/sec, {format_bytes(bytes_per_sec)}/sec\n")
     
-    print(f"{GREEN}Workers:{RESET} {len(worker_stats)} total", file=sys.stderr)
+    parts.append(f"{GREEN}Workers:{RESET} {len(worker_stats)} total\n")
     
     if interrupted_workers > 0:
-        print(f"{YELLOW}Interrupted Workers:{RESET} {interrupted_workers}", file=sys.stderr)
+        parts.append(f"{YELLOW}Interrupted Workers:{RESET} {interrupted_workers}\n")
     
     # Per-worker statistics if multiple workers
     if len(worker_stats) > 1:
-        print(f"\n{BLUE}Per-Worker Statistics:{RESET}", file=sys.stderr)
+        parts.append(f"\n{BLUE}Per-Worker Statistics:{RESET}\n")
         for i, stats in enumerate(worker_stats):
             status = f"{RED}(interrupted){RESET}" if stats.interrupted else f"{GREEN}(completed){RESET}"
-            print(f"  Worker {i+1}: {stats.lines_output:,} lines, {stats.rate():,.0f} lines/sec {status}", file=sys.stderr)
+            parts.append(f"  Worker {i+1}: {stats.lines_output:,} lines, {stats.rate():,.0f} lines/sec {status}\n")
+    
+    sys.stderr.write("".join(parts))
+    sys.stderr.flush()
+
+def collect_worker_stats(stats_queue, workers: int, debug: bool = False) -> List[WorkerStats]:
+    """Collect the stats message each worker posts on exit, reporting any errors."""
+    worker_stats = []
+    # A killed worker never posts, so stop waiting after a short timeout
+    while len(worker_stats) < workers:
+        try:
+            msg_type, worker_id, data = stats_queue.get(timeout=0.5)
+        except queue.Empty:
+            break
+        if msg_type == 'stats':
+            worker_stats.append(data)
+        elif msg_type == 'error' and debug:
+            print(f"[DEBUG] Worker {worker_id} error: {data}", file=sys.stderr)
+    return worker_stats
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def format_bytes(bytes_count: Union[int, float]) -> str:
     """Format bytes in human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_count < 1024.0:
-            return f"{bytes_count:.1f} {unit}"
-        bytes_count /= 1024.0
-    return f"{bytes_count:.1f} PB"
+    # Each unit is 2**10 times the last, so the bit length picks the unit directly
+    unit_idx = min(max(0, (int(bytes_count).bit_length() - 1) // 10), len(_BYTE_UNITS) - 1)
+    return f"{bytes_count / (1 << (10 * unit_idx)):.1f} {_BYTE_UNITS[unit_idx]}"
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Main Application
@@ -529,6 +646,14 @@ def main(argv=None):
     # Determine count
     count = args.count if args.count is not None else float("inf")
     
+    # Workers printing the same line to stdout only contend for the pipe, which a
+    # single block writer already saturates, so fold them into one worker
+    if args.workers > 1 and args.output is None and args.mode == "normal" and args.delay == 0:
+        print(f"[WARNING] {args.workers} workers would only contend for stdout in normal mode; "
+              f"using a single worker", file=sys.stderr)
+        count *= args.workers
+        args.workers = 1
+    
     # Debug info
     if args.debug:
         print(f"[DEBUG] Text: '{text}', Count: {count}, Workers: {args.workers}", file=sys.stderr)
@@ -541,19 +666,21 @@ def main(argv=None):
     try:
         if args.use_threads or args.workers == 1:
             # Use threading for single worker or when explicitly requested
-            stats_queue = queue.Queue()
+            stats_list: List[WorkerStats] = []
             stop_event = threading.Event()
             threads = []
             
             for i in range(args.workers):
                 if args.workers == 1:
                     # Single threaded execution
-                    yes_worker(0, text, count, args.delay, args.quiet, args.output, args.mode, None)
+                    worker_stats.append(
+                        yes_worker(0, text, count, args.delay, args.quiet, args.output, args.mode, None)
+                    )
                 else:
                     # Multi-threaded execution
                     thread = threading.Thread(
                         target=threaded_yes_worker,
-                        args=(i, text, count, args.delay, args.quiet, args.mode, stats_queue, stop_event)
+                        args=(i, text, count, args.delay, args.quiet, args.mode, stats_list, stop_event)
                     )
                     thread.start()
                     threads.append(thread)
@@ -572,20 +699,22 @@ def main(argv=None):
                         thread.join(timeout=1.0)
                 
                 # Collect statistics
-                while not stats_queue.empty():
-                    msg_type, worker_id, data = stats_queue.get()
-                    if msg_type == 'stats':
-                        worker_stats.append(data)
-                    elif msg_type == 'error' and args.debug:
-                        print(f"[DEBUG] Worker {worker_id} error: {data}", file=sys.stderr)
+                worker_stats = list(stats_list)
         
         else:
-            # Use multiprocessing
-            stats_queue = multiprocessing.Queue()
+            # Use multiprocessing; on Linux fork the children so they inherit the
+            # parsed arguments and imported modules instead of re-importing this
+            # module and unpickling everything per child
+            if sys.platform.startswith("linux"):
+                mp_context = multiprocessing.get_context("fork")
+            else:
+                mp_context = multiprocessing.get_context()
+            # Only --stats and --debug read what the workers report
+            stats_queue = mp_context.Queue() if args.stats or args.debug else None
             processes = []
             
             for i in range(args.workers):
-                process = multiprocessing.Process(
+                process = mp_context.Process(
                     target=yes_worker,
                     args=(i, text, count, args.delay, args.quiet, args.output, args.mode, stats_queue)
                 )
@@ -608,15 +737,8 @@ def main(argv=None):
                         process.kill()
             
             # Collect statistics
-            while not stats_queue.empty():
-                try:
-                    msg_type, worker_id, data = stats_queue.get_nowait()
-                    if msg_type == 'stats':
-                        worker_stats.append(data)
-                    elif msg_type == 'error' and args.debug:
-                        print(f"[DEBUG] Worker {worker_id} error: {data}", file=sys.stderr)
-                except queue.Empty:
-                    break
+            if stats_queue is not None:
+                worker_stats = collect_worker_stats(stats_queue, args.workers, args.debug)
     
     except KeyboardInterrupt:
         if args.debug: